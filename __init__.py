@@ -1,49 +1,83 @@
 """Blender Extension entrypoint for Blender MCP."""
-# ruff: noqa: N999
+# ruff: noqa: N999, E402
 
-from __future__ import annotations
+# Keep bl_info a plain dict literal: Blender reads it from source with
+# ast.literal_eval, and its identifier-like keys are already interned.
+bl_info = {
+    "name": "Blender MCP",
+    "author": "BlenderMCP",
+    "version": (1, 3, 5),
+    "blender": (3, 0, 0),
+    "location": "View3D > Sidebar > BlenderMCP",
+    "description": "Connect Blender to local LLM clients via MCP",
+    "category": "Interface",
+}
 
 import importlib
-import importlib.util
-from pathlib import Path
+import os
+import sys
+
+_ADDON_PATH = os.path.join(os.path.dirname(__file__), "addon.py")
+_ADDON_SPEC_NAME = "blender_mcp_addon_entry"
+_ADDON_MOD = None
 
 
 def _load_addon_module():
-    try:
-        if __package__:
-            return importlib.import_module(".addon", package=__package__)
-    except Exception:
-        pass
+    global _ADDON_MOD
+    if _ADDON_MOD is not None:
+        return _ADDON_MOD
+
+    if __package__:
+        module = sys.modules.get(f"{__package__}.addon")
+        if module is None:
+            module = importlib.import_module(".addon", package=__package__)
+        _ADDON_MOD = module
+        return module
+
+    # A previous load through the fallback below is still registered under its
+    # spec name, so reuse it instead of building a new spec.
+    module = sys.modules.get(_ADDON_SPEC_NAME)
+    if module is not None:
+        _ADDON_MOD = module
+        return module
 
-    addon_path = Path(__file__).with_name("addon.py")
-    spec = importlib.util.spec_from_file_location("blender_mcp_addon_entry", addon_path)
+    # Fallback for loading this file outside a package; only this path needs
+    # importlib.util, so keep it off the common import path.
+    from importlib.util import module_from_spec, spec_from_file_location
+
+    spec = spec_from_file_location(_ADDON_SPEC_NAME, _ADDON_PATH)
     if spec is None or spec.loader is None:
-        raise ImportError(f"Could not load addon module from {addon_path}")
-    module = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(module)
+        raise ImportError(f"Could not load addon module from {_ADDON_PATH}")
+    module = module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # Don't leave a half-initialised module for the lookup above to reuse
+        sys.modules.pop(spec.name, None)
+        raise
+    _ADDON_MOD = module
     return module
 
 
-bl_info = {
-    "name": "Blender MCP",
-    "author": "BlenderMCP",
-    "version": (1, 3, 5),
-    "blender": (3, 0, 0),
-    "location": "View3D > Sidebar > BlenderMCP",
-    "description": "Connect Blender to local LLM clients via MCP",
-    "category": "Interface",
-}
+def _bind_entrypoints():
+    """Replace this module's register/unregister with the addon's own functions."""
+    module = _load_addon_module()
+    globals().update(register=module.register, unregister=module.unregister)
+    return module
 
 
+# Boot stubs: the first call loads the addon and rebinds both names, so later
+# calls from Blender go straight to addon.register/addon.unregister.
 def register():
-    _load_addon_module().register()
+    _bind_entrypoints().register()
 
 
 def unregister():
-    _load_addon_module().unregister()
+    # Nothing to tear down if register() never loaded the addon.
+    if _ADDON_MOD is None:
+        return
+    _bind_entrypoints().unregister()
 
 __all__ = ["bl_info", "register", "unregister"]
 
-
-if __name__ == "__main__":
-    register()
@@ -1,24 +1,39 @@
 # Code created by Siddharth Ahuja: www.github.com/ahujasid © 2025
 
+import errno
+import functools
+import hashlib
 import importlib.util
 import io
+import itertools
 import json
+import logging
 import os
 import platform
 import shutil
+import sqlite3
+import struct
 import subprocess
 import sys
 import tempfile
+import threading
 import time
 import traceback
 import zipfile
+import zlib
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import redirect_stdout, suppress
+from typing import TYPE_CHECKING
 
 import bpy
-import mathutils
-import requests
 from bpy.props import IntProperty
 
+if TYPE_CHECKING:
+    import requests
+
+logger = logging.getLogger("BlenderMCP")
+
 
 def _load_socket_server_class():
     """Load addon/server.py robustly in both legacy addon and extension modes."""
@@ -50,6 +65,27 @@ except ImportError:
         return None
 
 
+# Optional ISA-L inflate for archive extraction; several times faster than stock
+# zlib on x86_64 when python-isal is installed into Blender's Python
+try:
+    from isal import isal_zlib
+
+    ISAL_AVAILABLE = True
+except ImportError:
+    ISAL_AVAILABLE = False
+
+# zlib-compatible module used to inflate and CRC-check extracted zip entries
+_entry_zlib = isal_zlib if ISAL_AVAILABLE else zlib
+
+# Optional Pillow for screenshot resizing outside of Blender's image pipeline
+try:
+    from PIL import Image as PILImage
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+
 bl_info = {
     "name": "Blender MCP",
     "author": "BlenderMCP",
@@ -60,13 +96,145 @@ bl_info = {
     "category": "Interface",
 }
 
-# Add User-Agent as required by Poly Haven API
-REQ_HEADERS = requests.utils.default_headers()
-REQ_HEADERS.update({"User-Agent": "blender-mcp"})
+# Add User-Agent as required by Poly Haven API. A plain dict is cheaper for
+# requests to merge than CaseInsensitiveDict; gzip keeps JSON listings small.
+REQ_HEADERS = {"User-Agent": "blender-mcp", "Accept-Encoding": "gzip, deflate"}
+
+
+def _make_session(headers: dict | None = None) -> "requests.Session":
+    """Create a pooled HTTPS session that retries dropped connections."""
+    # requests (urllib3, ssl, idna, ...) is imported on first network use
+    # rather than while Blender starts up and registers the add-on.
+    import requests
+    from urllib3.util.retry import Retry
+
+    session = requests.Session()
+    if headers:
+        session.headers.update(headers)
+    # Gateway errors are transient on the asset CDNs; after the last retry the
+    # response is returned as is so callers report its status code
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    session.mount(
+        "https://",
+        requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16, max_retries=retries),
+    )
+    return session
+
+
+# Shared sessions keep TLS connections alive across the several requests a
+# single asset search/download makes. Sketchfab auth is sent per request since
+# the API key can change in the UI, and must not leak to its download CDN.
+@functools.cache
+def _polyhaven_session() -> "requests.Session":
+    """Return the shared Poly Haven session, creating it on first use."""
+    return _make_session(REQ_HEADERS)
+
+
+@functools.cache
+def _sketchfab_session() -> "requests.Session":
+    """Return the shared Sketchfab session, creating it on first use."""
+    return _make_session()
+
+
+def _close_sessions() -> None:
+    """Drop pooled connections; sessions are recreated lazily on next use."""
+    for get_session in (_polyhaven_session, _sketchfab_session):
+        if get_session.cache_info().currsize:
+            get_session().close()
+            get_session.cache_clear()
+
+
+POLYHAVEN_DOWNLOAD_WORKERS = 8  # Texture maps fetched concurrently per material
+ZIP_EXTRACT_WORKERS = min(8, os.cpu_count() or 4)  # zlib releases the GIL while inflating
+POLYHAVEN_ASSET_TYPES = frozenset({"hdris", "textures", "models"})
+POLYHAVEN_CATEGORY_TYPES = POLYHAVEN_ASSET_TYPES | {"all"}
+POLYHAVEN_API_TTL = 300  # Seconds an API listing is reused before revalidating
+POLYHAVEN_CATEGORIES_TTL = 24 * 3600  # Category counts change on the order of days
+
+# (url, params) -> (etag, parsed body, monotonic fetch time) for Poly Haven API calls
+_POLYHAVEN_API_CACHE: dict[tuple, tuple[str | None, object, float]] = {}
+
+SKETCHFAB_STATUS_TTL = 600  # Seconds a validated API key's /me reply is reused
+SKETCHFAB_SEARCH_TTL = 60  # Seconds a search result is reused
+
+# (url, params, api key digest) -> (monotonic expiry, parsed body) for Sketchfab calls
+_SKETCHFAB_API_CACHE: dict[tuple, tuple[float, object]] = {}
+
+# API key digest -> {"username", "validated_at"} for keys /me has accepted; only
+# digests are stored, never the key itself
+SKETCHFAB_KEY_CACHE = os.path.join(os.path.expanduser("~"), ".blender_mcp", "sketchfab_keys.json")
+SKETCHFAB_KEY_CACHE_TTL = 24 * 3600  # Seconds a validated key is trusted without /me
+
+# Streaming chunk size for asset downloads; large enough that multi-MB HDRIs and
+# texture maps and 100+ MB Sketchfab archives take few Python loop iterations.
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+# Seconds between progress tracker updates while streaming a download; matches
+# the download progress operator's timer, which never reads more often
+PROGRESS_REPORT_INTERVAL = 0.1
 
 # MP-05: Asset cache configuration
 CACHE_DIR = os.path.join(os.path.expanduser("~"), ".blender_mcp", "cache")
 CACHE_TTL_DAYS = 7  # Cache expires after 7 days
+CACHE_HIT_ENTRIES = 1024  # In-memory hit entries kept by AssetCache
+CACHE_INDEX_NAME = "index.db"  # SQLite index of cached files, kept in CACHE_DIR
+CACHE_SWEEP_INTERVAL = 3600  # Seconds between batch removals of expired entries
+CACHE_META_DIR = "meta"  # Subdirectory of CACHE_DIR for cached API metadata
+CACHE_TMP_DIR = "tmp"  # Subdirectory of CACHE_DIR for in-flight downloads
+CACHE_SIZE_DISPLAY_TTL = 2.0  # Seconds the panel reuses a cache size reading
+# copy_file_range failures that mean "use a regular copy instead"
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM, errno.EBADF}
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cache_key_hash(asset_id: str, asset_type: str, resolution: str) -> str:
+    """Hash asset identifiers into a filename-safe cache key."""
+    cache_key = f"{asset_id}_{asset_type}_{resolution}"
+    # Not a security boundary: BLAKE2b-128 is cheaper than SHA-256 and
+    # yields shorter filenames.
+    return hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _copy_file(source_path: str, dest_path: str) -> None:
+    """Copy a file and its metadata, letting the kernel move the bytes when possible.
+
+    Uses os.copy_file_range (Linux) so same-filesystem copies can be reflinked or
+    done in-kernel, and falls back to shutil.copyfile where it is unsupported.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    written = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if written == 0:
+                        break
+                    remaining -= written
+                copied = remaining == 0
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    if not copied:
+        shutil.copyfile(source_path, dest_path)
+    shutil.copystat(source_path, dest_path)
+
+
+def _move_file(source_path: str, dest_path: str) -> bool:
+    """Rename a file into place; False if it lives on another filesystem."""
+    try:
+        os.replace(source_path, dest_path)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        return False
+    return True
 
 
 class AssetCache:
@@ -75,77 +243,276 @@ class AssetCache:
     def __init__(self, cache_dir=CACHE_DIR, ttl_days=CACHE_TTL_DAYS):
         self.cache_dir = cache_dir
         self.ttl_seconds = ttl_days * 24 * 3600
+        # cache path -> expiry epoch for entries already known to be on disk
+        self._hit_cache = OrderedDict()
+        self._hit_lock = threading.Lock()
         os.makedirs(cache_dir, exist_ok=True)
+        # In-flight downloads live here: same filesystem as the cache, so storing
+        # them is a rename, but out of reach of clear()'s stray-file sweep
+        self.tmp_dir = os.path.join(cache_dir, CACHE_TMP_DIR)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        self._index_lock = threading.Lock()
+        self._index = self._open_index()
+        # monotonic time of the next expired-entry sweep; 0 sweeps on first get()
+        self._next_sweep = 0.0
+        # (monotonic time, (bytes, files)) of the last size query; reset on any index change
+        self._size_memo = None
+
+    def _open_index(self) -> sqlite3.Connection:
+        """Open (or create) the SQLite index that describes the cached files."""
+        conn = sqlite3.connect(
+            os.path.join(self.cache_dir, CACHE_INDEX_NAME), check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "mtime REAL NOT NULL, expiry REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_expiry ON entries (expiry)")
+        conn.commit()
+        return conn
 
     def _get_cache_path(self, asset_id: str, asset_type: str, resolution: str = "") -> str:
         """Generate cache file path from asset identifiers."""
-        import hashlib
+        cache_hash = _cache_key_hash(asset_id, asset_type, resolution)
+        # "v2_" marks the BLAKE2b key format; older SHA-256 entries are never
+        # looked up again and are removed by clear().
+        return os.path.join(self.cache_dir, f"v2_{cache_hash}.cache")
+
+    def _remember_hit(self, cache_path: str, expires_at: float) -> None:
+        """Record a known-good cache entry, evicting the oldest beyond the cap."""
+        with self._hit_lock:
+            self._hit_cache[cache_path] = expires_at
+            self._hit_cache.move_to_end(cache_path)
+            if len(self._hit_cache) > CACHE_HIT_ENTRIES:
+                self._hit_cache.popitem(last=False)
+
+    def _recall_hit(self, cache_path: str) -> bool:
+        """Return True if cache_path is a remembered, unexpired entry."""
+        with self._hit_lock:
+            expires_at = self._hit_cache.get(cache_path)
+            if expires_at is None:
+                return False
+            if time.time() < expires_at:
+                self._hit_cache.move_to_end(cache_path)
+                return True
+            del self._hit_cache[cache_path]
+            return False
+
+    def _index_expiry(self, cache_path: str) -> float | None:
+        """Return the indexed expiry epoch for a cache path, None if not indexed."""
+        with self._index_lock:
+            row = self._index.execute(
+                "SELECT expiry FROM entries WHERE path = ?", (cache_path,)
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def _index_put(self, cache_path: str) -> float:
+        """Index a cached file and return its expiry epoch."""
+        st = os.stat(cache_path)
+        expires_at = st.st_mtime + self.ttl_seconds
+        with self._index_lock:
+            self._index.execute(
+                "INSERT OR REPLACE INTO entries (path, size, mtime, expiry) VALUES (?, ?, ?, ?)",
+                (cache_path, st.st_size, st.st_mtime, expires_at),
+            )
+            self._index.commit()
+            self._size_memo = None
+        return expires_at
+
+    def _index_drop(self, cache_path: str) -> None:
+        """Remove a cache entry from the index and from disk."""
+        # Evict and delete under _hit_lock so get() never serves a removed file
+        with self._hit_lock:
+            self._hit_cache.pop(cache_path, None)
+            with self._index_lock:
+                self._index.execute("DELETE FROM entries WHERE path = ?", (cache_path,))
+                self._index.commit()
+                self._size_memo = None
+            with suppress(FileNotFoundError):
+                os.remove(cache_path)
 
-        cache_key = f"{asset_id}_{asset_type}_{resolution}"
-        cache_hash = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
-        return os.path.join(self.cache_dir, f"{cache_hash}.cache")
+    def _sweep_expired(self) -> int:
+        """Drop every expired entry in one batch. Returns number of entries removed."""
+        now = time.time()
+        with self._hit_lock:
+            with self._index_lock:
+                paths = [
+                    row[0]
+                    for row in self._index.execute(
+                        "SELECT path FROM entries WHERE expiry <= ?", (now,)
+                    )
+                ]
+                self._index.execute("DELETE FROM entries WHERE expiry <= ?", (now,))
+                self._index.commit()
+                self._size_memo = None
+            for path in paths:
+                self._hit_cache.pop(path, None)
+                with suppress(FileNotFoundError):
+                    os.remove(path)
+        return len(paths)
 
     def get(self, asset_id: str, asset_type: str, resolution: str = "") -> str | None:
         """Retrieve cached asset path if valid, None otherwise."""
         cache_path = self._get_cache_path(asset_id, asset_type, resolution)
 
-        if not os.path.exists(cache_path):
+        if time.monotonic() >= self._next_sweep:
+            self._next_sweep = time.monotonic() + CACHE_SWEEP_INTERVAL
+            try:
+                self._sweep_expired()
+            except (OSError, sqlite3.Error) as e:
+                print(f"Failed to sweep expired cache entries: {e}")
+
+        # Memory hits skip the index but still confirm the file is there
+        if self._recall_hit(cache_path):
+            if os.path.exists(cache_path):
+                return cache_path
+            # Deleted behind the cache's back; the index lookup below drops it too
+            with self._hit_lock:
+                self._hit_cache.pop(cache_path, None)
+
+        expires_at = self._index_expiry(cache_path)
+        if expires_at is None:
             return None
 
         # Check if cache is expired
-        file_age = time.time() - os.path.getmtime(cache_path)
-        if file_age > self.ttl_seconds:
+        if time.time() >= expires_at:
             try:
-                os.remove(cache_path)
+                self._index_drop(cache_path)
             except OSError:
                 pass
             return None
 
+        # The index can outlive files deleted behind its back (another Blender
+        # process clearing the cache, a removed cache folder); forget those
+        if not os.path.exists(cache_path):
+            try:
+                self._index_drop(cache_path)
+            except sqlite3.Error:
+                pass
+            return None
+
+        self._remember_hit(cache_path, expires_at)
         return cache_path
 
-    def put(self, asset_id: str, asset_type: str, source_path: str, resolution: str = "") -> str:
-        """Store asset in cache and return cache path."""
+    def put(
+        self,
+        asset_id: str,
+        asset_type: str,
+        source_path: str,
+        resolution: str = "",
+        move: bool = False,
+    ) -> str:
+        """Store asset in cache and return cache path.
+
+        With move=True the source is renamed into the cache when it is on the
+        same filesystem, so the caller must not use source_path afterwards.
+        """
         cache_path = self._get_cache_path(asset_id, asset_type, resolution)
 
+        moved = False
         try:
-            shutil.copy2(source_path, cache_path)
+            # Callers done with the source let it be renamed in; across filesystems
+            # it is copied as usual and stays where it was
+            moved = move and _move_file(source_path, cache_path)
+            if not moved:
+                _copy_file(source_path, cache_path)
+            # rename and copy both preserve the source mtime, which expiry is based on
+            self._remember_hit(cache_path, self._index_put(cache_path))
             return cache_path
         except Exception as e:
             print(f"Failed to cache asset: {e}")
+            if moved:
+                # The source was renamed away; put it back so the returned path exists
+                try:
+                    os.replace(cache_path, source_path)
+                except OSError:
+                    return cache_path
             return source_path
 
     def clear(self) -> int:
         """Clear all cached assets. Returns number of files deleted."""
         deleted = 0
         try:
-            for filename in os.listdir(self.cache_dir):
-                filepath = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(filepath):
-                    os.remove(filepath)
-                    deleted += 1
+            # Memory hits are evicted in the same critical section as the deletes
+            with self._hit_lock:
+                self._hit_cache.clear()
+                with self._index_lock:
+                    paths = [row[0] for row in self._index.execute("SELECT path FROM entries")]
+                    self._index.execute("DELETE FROM entries")
+                    self._index.commit()
+                    self._size_memo = None
+                for path in paths:
+                    with suppress(FileNotFoundError):
+                        os.remove(path)
+                        deleted += 1
+                # Files that predate the index (or were never indexed) go as well
+                with os.scandir(self.cache_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(CACHE_INDEX_NAME):
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            os.remove(entry.path)
+                            deleted += 1
         except Exception as e:
             print(f"Error clearing cache: {e}")
         return deleted
 
-    def get_cache_size(self) -> tuple[int, int]:
-        """Get cache size in bytes and number of files."""
-        total_size = 0
-        file_count = 0
+    def _json_path(self, key: str) -> str:
+        """Path of the metadata file stored under key."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, CACHE_META_DIR, f"{digest}.json")
+
+    def get_json(self, key: str) -> tuple[object, float] | None:
+        """Return (value, age in seconds) of stored JSON metadata, None if absent."""
+        path = self._json_path(key)
         try:
-            for filename in os.listdir(self.cache_dir):
-                filepath = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(filepath):
-                    total_size += os.path.getsize(filepath)
-                    file_count += 1
-        except OSError:
-            pass
-        return total_size, file_count
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+            age = time.time() - os.path.getmtime(path)
+        except (OSError, ValueError):
+            return None
+        return value, age
+
+    def put_json(self, key: str, value: object) -> None:
+        """Store JSON-serializable metadata under key, replacing it atomically."""
+        path = self._json_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Failed to store cached metadata: {e}")
+
+    def get_cache_size(self, max_age: float = 0.0) -> tuple[int, int]:
+        """Get cache size in bytes and number of files.
+
+        A result from the last max_age seconds is reused if the index has not
+        changed since, so UI redraws don't query the index every frame.
+        """
+        memo = self._size_memo
+        if memo is not None and time.monotonic() - memo[0] < max_age:
+            return memo[1]
+        try:
+            with self._index_lock:
+                size = self._index.execute(
+                    "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries"
+                ).fetchone()
+                self._size_memo = (time.monotonic(), size)
+        except sqlite3.Error:
+            return 0, 0
+        return size
 
 
 # Global cache instance
 _asset_cache = AssetCache()
 
 
+@functools.cache
 def _project_root() -> str:
     """Return repository root path based on addon.py location."""
     return os.path.dirname(os.path.abspath(__file__))
@@ -227,22 +594,18 @@ def _install_runtime_dependencies_with_pip(cwd: str) -> tuple[int, str]:
     return _run_command([sys.executable, "-m", "pip", "install", "--upgrade", "requests>=2.25.0"], cwd=cwd)
 
 
+@functools.lru_cache(maxsize=32)
 def _mcp_client_config_snippet(client: str, host: str, port: int) -> str:
     """Generate stdio config snippets for MCP-compatible clients."""
     args = ["run", "blender-mcp", "--host", host, "--port", str(port)]
     config = {"mcpServers": {"blender": {"command": "uv", "args": args}}}
-    if client == "claude":
-        return json.dumps(config, indent=2)
-    if client == "cursor":
-        return json.dumps(config, indent=2)
-    if client == "lm_studio":
-        return json.dumps(config, indent=2)
+    snippet = json.dumps(config, indent=2)
     if client == "ollama":
         return (
-            "Use this in your MCP-capable Ollama client (Continue/Open WebUI/etc):\n"
-            + json.dumps(config, indent=2)
+            "Use this in your MCP-capable Ollama client (Continue/Open WebUI/etc):\n" + snippet
         )
-    return json.dumps(config, indent=2)
+    # claude, cursor, lm_studio and any other client share the plain config
+    return snippet
 
 
 def _update_action_status(scene, action: str, ok: bool, details: str = "") -> None:
@@ -253,8 +616,13 @@ def _update_action_status(scene, action: str, ok: bool, details: str = "") -> No
     scene.blendermcp_last_action_at = time.strftime("%Y-%m-%d %H:%M:%S")
 
 
+@functools.cache
 def _logs_path() -> str:
-    """Resolve current log path from env or default value."""
+    """Resolve current log path from env or default value.
+
+    The result is memoized; call ``_logs_path.cache_clear()`` after changing
+    ``BLENDER_MCP_LOG_FILE`` at runtime.
+    """
     log_file = os.getenv("BLENDER_MCP_LOG_FILE", "blender_mcp.log")
     if os.path.isabs(log_file):
         return log_file
@@ -272,54 +640,704 @@ def _open_in_system(path: str) -> None:
     subprocess.Popen(["xdg-open", path])
 
 
+# Color-space names differ between Blender/OCIO configs. Resolve each kind once
+# on first use (bpy.data is restricted while register() runs) so image imports
+# assign directly instead of retrying inside try/except on every download.
+_COLORSPACE_CANDIDATES = {
+    "hdr": ("Linear", "Linear Rec.709", "Non-Color"),
+    "exr": ("Linear", "Non-Color"),
+    "srgb": ("sRGB",),
+    "non_color": ("Non-Color",),
+}
+_COLORSPACES: dict[str, str | None] = {}
+
+
+def _probe_colorspaces() -> None:
+    """Resolve the first supported name for every color-space kind."""
+    probe = bpy.data.images.new("blendermcp_colorspace_probe", 1, 1)
+    try:
+        for kind, candidates in _COLORSPACE_CANDIDATES.items():
+            _COLORSPACES[kind] = None
+            for name in candidates:
+                try:
+                    probe.colorspace_settings.name = name
+                except Exception:
+                    continue
+                _COLORSPACES[kind] = name
+                break
+    finally:
+        bpy.data.images.remove(probe)
+
+
+def _set_colorspace(image, kind: str) -> None:
+    """Assign the cached color space for kind, keeping Blender's default if none."""
+    if not _COLORSPACES:
+        _probe_colorspaces()
+    name = _COLORSPACES.get(kind)
+    if name:
+        image.colorspace_settings.name = name
+
+
+# Texture map names grouped by the material input they drive
+_COLOR_MAPS = frozenset({"color", "diffuse", "albedo"})
+_ROUGH_MAPS = frozenset({"roughness", "rough"})
+_METAL_MAPS = frozenset({"metallic", "metalness", "metal"})
+_NORMAL_MAPS = frozenset({"normal", "nor", "dx", "gl"})
+_DISP_MAPS = frozenset({"displacement", "disp", "height"})
+_MAP_CATEGORY = {
+    name: category
+    for category, names in (
+        ("color", _COLOR_MAPS),
+        ("roughness", _ROUGH_MAPS),
+        ("metallic", _METAL_MAPS),
+        ("normal", _NORMAL_MAPS),
+        ("displacement", _DISP_MAPS),
+    )
+    for name in names
+}
+# Categories whose texture color feeds a Principled BSDF input directly
+_PRINCIPLED_INPUTS = {"color": "Base Color", "roughness": "Roughness", "metallic": "Metallic"}
+
+
+def _texture_colorspace(map_type: str) -> str:
+    """Return the color-space kind for a texture map type."""
+    return "srgb" if map_type.lower() in _COLOR_MAPS else "non_color"
+
+
+def _texture_node_locations(count: int) -> list[tuple[int, int]]:
+    """Return the column of (x, y) locations for texture nodes, top to bottom."""
+    return [(-400, 300 - 250 * i) for i in range(count)]
+
+
+def _build_node_graph(node_tree, node_specs, link_specs):
+    """Replace a node tree's contents with nodes and links described by specs.
+
+    node_specs are (key, node type, location, {attribute: value}) tuples and
+    link_specs are (from key, output socket, to key, input socket) tuples.
+    Returns the created nodes by key.
+    """
+    nodes = node_tree.nodes
+    nodes.clear()
+    new_node = nodes.new
+    built = {}
+    for key, node_type, location, props in node_specs:
+        node = new_node(type=node_type)
+        node.location = location
+        for attr, value in props.items():
+            setattr(node, attr, value)
+        built[key] = node
+
+    new_link = node_tree.links.new
+    for from_key, from_socket, to_key, to_socket in link_specs:
+        new_link(built[from_key].outputs[from_socket], built[to_key].inputs[to_socket])
+    return built
+
+
+def _build_texture_material_base(material, output_x: float, principled_x: float):
+    """Reset a material to Principled BSDF -> output plus a UV texture mapping.
+
+    Returns (mapping, principled, output) nodes for wiring texture maps.
+    """
+    built = _build_node_graph(
+        material.node_tree,
+        (
+            ("output", "ShaderNodeOutputMaterial", (output_x, 0), {}),
+            ("principled", "ShaderNodeBsdfPrincipled", (principled_x, 0), {}),
+            ("tex_coord", "ShaderNodeTexCoord", (-800, 0), {}),
+            # TEXTURE instead of the default POINT mapping
+            ("mapping", "ShaderNodeMapping", (-600, 0), {"vector_type": "TEXTURE"}),
+        ),
+        (
+            ("principled", 0, "output", 0),
+            ("tex_coord", "UV", "mapping", "Vector"),
+        ),
+    )
+    return built["mapping"], built["principled"], built["output"]
+
+
+def _wire_texture_map(
+    nodes,
+    links,
+    mapping,
+    principled,
+    output,
+    map_type: str,
+    image,
+    location: tuple[float, float],
+    displacement_scale: float | None = None,
+):
+    """Add an image texture node for one map and connect it to the material.
+
+    The image's color space is expected to be set already. Returns the new
+    texture node.
+    """
+    x_pos, y_pos = location
+    tex_node = nodes.new(type="ShaderNodeTexImage")
+    tex_node.location = location
+    tex_node.image = image
+    links.new(mapping.outputs["Vector"], tex_node.inputs["Vector"])
+
+    # Connect to appropriate input on Principled BSDF
+    category = _MAP_CATEGORY.get(map_type.lower())
+    if category in _PRINCIPLED_INPUTS:
+        links.new(tex_node.outputs["Color"], principled.inputs[_PRINCIPLED_INPUTS[category]])
+    elif category == "normal":
+        # Add normal map node
+        normal_map = nodes.new(type="ShaderNodeNormalMap")
+        normal_map.location = (x_pos + 200, y_pos)
+        links.new(tex_node.outputs["Color"], normal_map.inputs["Color"])
+        links.new(normal_map.outputs["Normal"], principled.inputs["Normal"])
+    elif category == "displacement":
+        # Add displacement node
+        disp_node = nodes.new(type="ShaderNodeDisplacement")
+        disp_node.location = (x_pos + 200, y_pos - 200)
+        if displacement_scale is not None:
+            disp_node.inputs["Scale"].default_value = displacement_scale
+        links.new(tex_node.outputs["Color"], disp_node.inputs["Height"])
+        links.new(disp_node.outputs["Displacement"], output.inputs["Displacement"])
+
+    return tex_node
+
+
+def _build_texture_material(name: str, texture_images: dict):
+    """Create a material wiring {map type: image} into a Principled BSDF."""
+    new_mat = bpy.data.materials.new(name=name)
+    new_mat.use_nodes = True
+
+    # Set up the material nodes
+    nodes = new_mat.node_tree.nodes
+    links = new_mat.node_tree.links
+    mapping, principled, output = _build_texture_material_base(
+        new_mat, output_x=600, principled_x=300
+    )
+
+    # Connect different texture maps, keeping each node by map type
+    texture_nodes = {}
+    locations = _texture_node_locations(len(texture_images))
+    for (map_type, image), location in zip(texture_images.items(), locations):
+        texture_nodes[map_type] = _wire_texture_map(
+            nodes,
+            links,
+            mapping,
+            principled,
+            output,
+            map_type,
+            image,
+            location,
+            displacement_scale=0.1,  # Reduce displacement strength
+        )
+
+    # Base color node that AO (from ARM or a separate map) is multiplied into
+    base_color_node = next(
+        (texture_nodes[m] for m in ("color", "diffuse", "albedo") if m in texture_nodes),
+        None,
+    )
+    base_color_input = principled.inputs["Base Color"]
+
+    # Handle ARM texture (Ambient Occlusion, Roughness, Metallic)
+    if "arm" in texture_nodes:
+        separate_rgb = nodes.new(type="ShaderNodeSeparateRGB")
+        separate_rgb.location = (-200, -100)
+        links.new(texture_nodes["arm"].outputs["Color"], separate_rgb.inputs["Image"])
+
+        # Connect Roughness (G) if no dedicated roughness map
+        if _ROUGH_MAPS.isdisjoint(texture_nodes):
+            links.new(separate_rgb.outputs["G"], principled.inputs["Roughness"])
+            logger.debug("Connected ARM.G to Roughness")
+
+        # Connect Metallic (B) if no dedicated metallic map
+        if _METAL_MAPS.isdisjoint(texture_nodes):
+            links.new(separate_rgb.outputs["B"], principled.inputs["Metallic"])
+            logger.debug("Connected ARM.B to Metallic")
+
+        # For AO (R channel), multiply with base color if we have one
+        if base_color_node:
+            mix_node = nodes.new(type="ShaderNodeMixRGB")
+            mix_node.location = (100, 200)
+            mix_node.blend_type = "MULTIPLY"
+            mix_node.inputs["Fac"].default_value = 0.8  # 80% influence
+
+            # Disconnect direct connection to base color (an input has at most one link)
+            for link in base_color_input.links:
+                links.remove(link)
+
+            # Connect through the mix node
+            links.new(base_color_node.outputs["Color"], mix_node.inputs[1])
+            links.new(separate_rgb.outputs["R"], mix_node.inputs[2])
+            links.new(mix_node.outputs["Color"], principled.inputs["Base Color"])
+            logger.debug("Connected ARM.R to AO mix with Base Color")
+
+    # Handle AO (Ambient Occlusion) if separate
+    if "ao" in texture_nodes and base_color_node:
+        mix_node = nodes.new(type="ShaderNodeMixRGB")
+        mix_node.location = (100, 200)
+        mix_node.blend_type = "MULTIPLY"
+        mix_node.inputs["Fac"].default_value = 0.8  # 80% influence
+
+        # Disconnect direct connection to base color (an input has at most one link)
+        for link in base_color_input.links:
+            links.remove(link)
+
+        # Connect through the mix node
+        links.new(base_color_node.outputs["Color"], mix_node.inputs[1])
+        links.new(texture_nodes["ao"].outputs["Color"], mix_node.inputs[2])
+        links.new(mix_node.outputs["Color"], principled.inputs["Base Color"])
+        logger.debug("Connected AO to mix with Base Color")
+
+    return new_mat
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_code(code: str):
+    """Compile execute_code source, reusing the code object for repeated snippets."""
+    # lru_cache keys on the string itself; str hashes are cached by CPython
+    return compile(code, "<string>", "exec")
+
+
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# JPEG start-of-frame markers (SOF0-SOF15, minus DHT/JPG/DAC) carry the image size
+_JPEG_SOF_MARKERS = frozenset(range(0xC0, 0xD0)) - {0xC4, 0xC8, 0xCC}
+
+
+def _read_image_size(path: str) -> tuple[int, int] | None:
+    """Read (width, height) from a PNG or JPEG header without decoding the image.
+
+    Returns None for other formats or malformed headers.
+    """
+    with open(path, "rb") as f:
+        header = f.read(24)
+        if header[:8] == _PNG_SIGNATURE and header[12:16] == b"IHDR":
+            return struct.unpack(">II", header[16:24])
+        if header[:2] != b"\xff\xd8":
+            return None
+        # Walk JPEG segments until a start-of-frame marker
+        f.seek(2)
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            length = f.read(2)
+            if len(length) < 2:
+                return None
+            if marker[1] in _JPEG_SOF_MARKERS:
+                frame = f.read(5)
+                if len(frame) < 5:
+                    return None
+                height, width = struct.unpack(">HH", frame[1:5])
+                return width, height
+            f.seek(struct.unpack(">H", length)[0] - 2, os.SEEK_CUR)
+
+
+def _resize_image_file(path: str, max_size: int, format: str) -> tuple[int, int]:
+    """Downscale an image file in place with Pillow so its largest side fits max_size.
+
+    Returns the resulting (width, height).
+    """
+    with PILImage.open(path) as im:
+        width, height = im.size
+        if max(width, height) <= max_size:
+            return width, height
+        scale = max_size / max(width, height)
+        width, height = int(width * scale), int(height * scale)
+        # Image.Resampling only exists from Pillow 9.1; older releases keep LANCZOS on Image
+        lanczos = getattr(PILImage, "Resampling", PILImage).LANCZOS
+        resized = im.resize((width, height), lanczos)
+    pil_format = "JPEG" if format.upper() in ("JPG", "JPEG") else format.upper()
+    if pil_format == "JPEG" and resized.mode not in ("RGB", "L"):
+        resized = resized.convert("RGB")
+    resized.save(path, pil_format)
+    return width, height
+
+
+def _polyhaven_get_json(
+    url: str, params: dict | None = None, ttl: float = POLYHAVEN_API_TTL
+) -> tuple[int, object]:
+    """GET a Poly Haven API endpoint, returning (status_code, parsed JSON body).
+
+    Bodies are reused for ttl seconds, then revalidated with If-None-Match so
+    an unchanged listing costs a 304 instead of a full download. They are also
+    kept in the asset cache, so a new Blender session starts warm. If the API
+    is unreachable, the last good body is served.
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    meta_key = f"polyhaven:{key!r}"
+    cached = _POLYHAVEN_API_CACHE.get(key)
+    if cached is None:
+        # First use this session: pick up what a previous session stored
+        stored = _asset_cache.get_json(meta_key)
+        if stored is not None:
+            (etag, body), age = stored
+            cached = _POLYHAVEN_API_CACHE[key] = (etag, body, time.monotonic() - age)
+    if cached and time.monotonic() - cached[2] < ttl:
+        return 200, cached[1]
+
+    import requests
+
+    headers = {"If-None-Match": cached[0]} if cached and cached[0] else None
+    try:
+        response = _polyhaven_session().get(url, params=params, headers=headers)
+    except requests.exceptions.RequestException:
+        if cached:
+            return 200, cached[1]
+        raise
+
+    if response.status_code == 304 and cached:
+        etag, body = cached[0], cached[1]
+    elif response.status_code == 200:
+        etag, body = response.headers.get("ETag"), response.json()
+    else:
+        return response.status_code, None
+
+    _POLYHAVEN_API_CACHE[key] = (etag, body, time.monotonic())
+    _asset_cache.put_json(meta_key, [etag, body])
+    return 200, body
+
+
+def _api_key_digest(api_key: str) -> str:
+    """Return a stable SHA-256 digest that identifies an API key without storing it."""
+    return hashlib.sha256(api_key.encode("utf-8")).hexdigest()
+
+
+def _load_validated_keys() -> dict:
+    """Read the on-disk validated Sketchfab key cache, {} if missing or unreadable."""
+    try:
+        with open(SKETCHFAB_KEY_CACHE, encoding="utf-8") as f:
+            keys = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return keys if isinstance(keys, dict) else {}
+
+
+def _validated_sketchfab_username(api_key: str) -> str | None:
+    """Return the cached username for a recently validated key, None otherwise."""
+    entry = _load_validated_keys().get(_api_key_digest(api_key))
+    if not isinstance(entry, dict):
+        return None
+    if time.time() - entry.get("validated_at", 0) >= SKETCHFAB_KEY_CACHE_TTL:
+        return None
+    return entry.get("username")
+
+
+def _store_validated_key(api_key: str, username: str | None) -> None:
+    """Record a validated key's username, or forget the key if username is None."""
+    now = time.time()
+    keys = {
+        digest: entry
+        for digest, entry in _load_validated_keys().items()
+        if isinstance(entry, dict)
+        and now - entry.get("validated_at", 0) < SKETCHFAB_KEY_CACHE_TTL
+    }
+    digest = _api_key_digest(api_key)
+    if username is None:
+        keys.pop(digest, None)
+    else:
+        keys[digest] = {"username": username, "validated_at": now}
+
+    try:
+        os.makedirs(os.path.dirname(SKETCHFAB_KEY_CACHE), exist_ok=True)
+        tmp_path = f"{SKETCHFAB_KEY_CACHE}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(keys, f)
+        os.replace(tmp_path, SKETCHFAB_KEY_CACHE)
+    except OSError as e:
+        logger.warning("Failed to update Sketchfab key cache: %s", e)
+
+
+def _sketchfab_get_json(
+    url: str, api_key: str, ttl: float, params: dict | None = None
+) -> tuple[int, object]:
+    """GET a Sketchfab API endpoint, returning (status_code, parsed JSON body).
+
+    Successful bodies are reused for ttl seconds per API key. A 401/403 drops
+    everything cached for that key.
+    """
+    key_digest = _api_key_digest(api_key)
+    query = tuple(sorted((name, str(value)) for name, value in (params or {}).items()))
+    key = (url, query, key_digest)
+    cached = _SKETCHFAB_API_CACHE.get(key)
+    if cached and time.monotonic() < cached[0]:
+        return 200, cached[1]
+
+    response = _sketchfab_session().get(
+        url, headers={"Authorization": f"Token {api_key}"}, params=params, timeout=30
+    )
+    if response.status_code in (401, 403):
+        for stale in [k for k in _SKETCHFAB_API_CACHE if k[2] == key_digest]:
+            del _SKETCHFAB_API_CACHE[stale]
+    if response.status_code != 200:
+        return response.status_code, None
+
+    body = response.json()
+    _SKETCHFAB_API_CACHE[key] = (time.monotonic() + ttl, body)
+    return 200, body
+
+
+def _blender_tempdir() -> str | None:
+    """Return Blender's per-session temp directory, None to use the system default."""
+    # bpy.app.tempdir sits where Blender itself writes and reads temporary data,
+    # and Blender removes it (with anything left behind) when it exits
+    return bpy.app.tempdir or None
+
+
+def _advise_sequential(f) -> None:
+    """Hint that an open file is accessed front to back (POSIX only)."""
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _drop_page_cache(path: str) -> None:
+    """Tell the kernel a file's cached pages won't be read again soon (POSIX only)."""
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _remove_tree_later(path: str) -> None:
+    """Delete a temp directory on a background thread.
+
+    Imported models can leave thousands of files behind; removing them
+    synchronously would delay the command's reply to the client.
+    """
+    threading.Thread(
+        target=shutil.rmtree, args=(path,), kwargs={"ignore_errors": True}, daemon=True
+    ).start()
+
+
+def _stream_to_file(response: "requests.Response", path: str) -> None:
+    """Write a streamed response body to path without holding it in memory."""
+    with open(path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+            f.write(chunk)
+
+
+def _fetch_polyhaven_file(
+    asset_id: str, asset_type: str, variant: str, file_url: str, dest_path: str
+) -> int:
+    """Place a Poly Haven file at dest_path, from the asset cache when possible.
+
+    Downloads (and caches) the file on a miss. Returns the HTTP status code,
+    200 for a cache hit.
+    """
+    cached_path = _asset_cache.get(asset_id, asset_type, variant)
+    if cached_path:
+        _copy_file(cached_path, dest_path)
+        return 200
+
+    with _polyhaven_session().get(file_url, stream=True) as response:
+        if response.status_code != 200:
+            return response.status_code
+        _stream_to_file(response, dest_path)
+    _asset_cache.put(asset_id, asset_type, dest_path, variant)
+    return 200
+
+
+def _tracked_chunks(response: "requests.Response", operation_id: str):
+    """Yield a streamed response body, reporting progress every PROGRESS_REPORT_INTERVAL."""
+    tracker = get_progress_tracker() if PROGRESS_AVAILABLE else None
+    if tracker is None:
+        yield from response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE)
+        return
+
+    tracker.start_operation(operation_id, int(response.headers.get("content-length", 0)))
+    downloaded = reported = 0
+    next_report = time.monotonic() + PROGRESS_REPORT_INTERVAL
+    # iter_content only yields empty chunks for keep-alives, which writes tolerate
+    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+        yield chunk
+        downloaded += len(chunk)
+        now = time.monotonic()
+        if now >= next_report:
+            tracker.update_progress(operation_id, downloaded)
+            reported = downloaded
+            next_report = now + PROGRESS_REPORT_INTERVAL
+    if downloaded != reported:
+        tracker.update_progress(operation_id, downloaded)
+    tracker.complete_operation(operation_id)
+
+
+# Zip local file header: signature, 22 bytes of fixed fields, then the file
+# name and extra field lengths that precede the entry's data
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+# Compressed bytes read per step; bounds what one inflate call can expand to
+_ZIP_READ_SIZE = 1 << 16
+
+
+def _entry_data_offset(zip_fd: int, file_info: zipfile.ZipInfo) -> int | None:
+    """Return the file offset of a zip entry's data, None if its local header is unusable."""
+    try:
+        signature, name_len, extra_len = _ZIP_LOCAL_HEADER.unpack(
+            os.pread(zip_fd, _ZIP_LOCAL_HEADER.size, file_info.header_offset)
+        )
+    except struct.error:
+        return None
+    if signature != b"PK\x03\x04":
+        return None
+    return file_info.header_offset + _ZIP_LOCAL_HEADER.size + name_len + extra_len
+
+
+def _inflate_entry(zip_fd: int, file_info: zipfile.ZipInfo, dst) -> bool:
+    """Decompress a stored or deflated zip entry into dst with positional reads.
+
+    Inflate and CRC-32 go through _entry_zlib (ISA-L when installed) without
+    touching zipfile's module state, and positional reads leave the shared
+    file position alone. Returns False, with dst left empty, when the entry
+    has to be read through zipfile instead (other compression methods,
+    encryption, no os.pread). Raises zipfile.BadZipFile on corrupt data.
+    """
+    method = file_info.compress_type
+    if (
+        not hasattr(os, "pread")
+        or method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+        or file_info.flag_bits & 0x1  # encrypted
+    ):
+        return False
+    offset = _entry_data_offset(zip_fd, file_info)
+    if offset is None:
+        return False
+
+    inflater = _entry_zlib.decompressobj(-15) if method == zipfile.ZIP_DEFLATED else None
+    crc = 0
+    size = 0
+    remaining = file_info.compress_size
+    while True:
+        if remaining > 0:
+            data = os.pread(zip_fd, min(remaining, _ZIP_READ_SIZE), offset)
+            if not data:
+                raise zipfile.BadZipFile(f"Truncated data for file {file_info.filename!r}")
+            offset += len(data)
+            remaining -= len(data)
+            if inflater is not None:
+                data = inflater.decompress(data)
+        elif inflater is not None:
+            data = inflater.flush()
+            inflater = None
+        else:
+            break
+        crc = _entry_zlib.crc32(data, crc)
+        size += len(data)
+        dst.write(data)
+
+    if size != file_info.file_size:
+        raise zipfile.BadZipFile(f"Bad size for file {file_info.filename!r}")
+    if crc != file_info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {file_info.filename!r}")
+    return True
+
+
+def _extract_zip_entries(zip_path: str, entries: list) -> None:
+    """Decompress (ZipInfo, target path) entries of zip_path concurrently.
+
+    A ZipFile handle is not safe to share across threads, so each worker
+    opens the archive once and reuses that handle for all its entries.
+    Every entry is CRC-checked, including archives served from the cache.
+    """
+    local = threading.local()
+    handles = []
+
+    def extract(entry):
+        file_info, target_path = entry
+        zip_ref = getattr(local, "zip_ref", None)
+        if zip_ref is None:
+            zip_ref = local.zip_ref = zipfile.ZipFile(zip_path, "r")
+            handles.append(zip_ref)
+        with open(target_path, "wb") as dst:
+            if _inflate_entry(zip_ref.fp.fileno(), file_info, dst):
+                return
+            with zip_ref.open(file_info) as src:
+                shutil.copyfileobj(src, dst, DOWNLOAD_CHUNK_SIZE)
+
+    try:
+        with ThreadPoolExecutor(max_workers=ZIP_EXTRACT_WORKERS) as pool:
+            # Consume the results so a failed entry raises here
+            for _ in pool.map(extract, entries):
+                pass
+    finally:
+        for zip_ref in handles:
+            zip_ref.close()
+
+
+def _fetch_polyhaven_map(operation_id: str, file_url: str) -> bytes | None:
+    """Download one texture map into memory, or return None on a non-200 reply.
+
+    Runs on worker threads: it only touches the network and the progress
+    tracker, never bpy.
+    """
+    with _polyhaven_session().get(file_url, stream=True) as response:
+        if response.status_code != 200:
+            return None
+        return b"".join(_tracked_chunks(response, operation_id))
+
+
 class BlenderMCPServer(SocketBlenderMCPServer):
     def __init__(self, host="localhost", port=9876):
         super().__init__(host=host, port=port)
         self.command_executor = self._execute_command_internal
-
-    def _execute_command_internal(self, command):
-        """Internal command execution with proper context"""
-        cmd_type = command.get("type")
-        params = command.get("params", {})
-
-        # Add a handler for checking PolyHaven status
-        if cmd_type == "get_polyhaven_status":
-            return {"status": "success", "result": self.get_polyhaven_status()}
-
+        self._handler_tables = self._build_handler_tables()
+        # texture asset id -> image names for textures downloaded this session
+        self._texture_images = {}
+        # texture asset id -> name of the material set_texture built from it
+        self._texture_materials = {}
+
+    def _build_handler_tables(self):
+        """Prebuild the command table for each (polyhaven, sketchfab) flag combination"""
         # Base handlers that are always available
-        handlers = {
+        base_handlers = {
             "get_scene_info": self.get_scene_info,
             "get_object_info": self.get_object_info,
             "get_viewport_screenshot": self.get_viewport_screenshot,
             "execute_code": self.execute_code,
             "get_polyhaven_status": self.get_polyhaven_status,
             "get_sketchfab_status": self.get_sketchfab_status,
+            "clear_asset_cache": self.clear_asset_cache,
+        }
+        # Polyhaven handlers, available only if enabled
+        polyhaven_handlers = {
+            "get_polyhaven_categories": self.get_polyhaven_categories,
+            "search_polyhaven_assets": self.search_polyhaven_assets,
+            "download_polyhaven_asset": self.download_polyhaven_asset,
+            "set_texture": self.set_texture,
+            "set_textures_bulk": self.set_textures_bulk,
+        }
+        # Sketchfab handlers, available only if enabled
+        sketchfab_handlers = {
+            "search_sketchfab_models": self.search_sketchfab_models,
+            "download_sketchfab_model": self.download_sketchfab_model,
         }
 
-        # Add Polyhaven handlers only if enabled
-        if bpy.context.scene.blendermcp_use_polyhaven:
-            polyhaven_handlers = {
-                "get_polyhaven_categories": self.get_polyhaven_categories,
-                "search_polyhaven_assets": self.search_polyhaven_assets,
-                "download_polyhaven_asset": self.download_polyhaven_asset,
-                "set_texture": self.set_texture,
-            }
-            handlers.update(polyhaven_handlers)
+        tables = {}
+        for use_polyhaven in (False, True):
+            for use_sketchfab in (False, True):
+                handlers = dict(base_handlers)
+                if use_polyhaven:
+                    handlers.update(polyhaven_handlers)
+                if use_sketchfab:
+                    handlers.update(sketchfab_handlers)
+                tables[use_polyhaven, use_sketchfab] = handlers
+        return tables
 
-        # Add Sketchfab handlers only if enabled
-        if bpy.context.scene.blendermcp_use_sketchfab:
-            sketchfab_handlers = {
-                "search_sketchfab_models": self.search_sketchfab_models,
-                "download_sketchfab_model": self.download_sketchfab_model,
-            }
-            handlers.update(sketchfab_handlers)
+    def _execute_command_internal(self, command):
+        """Internal command execution with proper context"""
+        cmd_type = command.get("type")
+        params = command.get("params", {})
+
+        # One RNA read per flag; the table for each combination is prebuilt
+        scene = bpy.context.scene
+        handlers = self._handler_tables[
+            bool(scene.blendermcp_use_polyhaven), bool(scene.blendermcp_use_sketchfab)
+        ]
 
         handler = handlers.get(cmd_type)
         if handler:
             try:
-                print(f"Executing handler for {cmd_type}")
+                logger.debug("Executing handler for %s", cmd_type)
                 result = handler(**params)
-                print("Handler execution complete")
                 return {"status": "success", "result": result}
             except Exception as e:
                 print(f"Error in handler: {str(e)}")
@@ -331,33 +1349,27 @@ class BlenderMCPServer(SocketBlenderMCPServer):
     def get_scene_info(self):
         """Get information about the current Blender scene"""
         try:
-            print("Getting scene info...")
+            scene = bpy.context.scene
+            objects = scene.objects
             # Simplify the scene info to reduce data size
             scene_info = {
-                "name": bpy.context.scene.name,
-                "object_count": len(bpy.context.scene.objects),
+                "name": scene.name,
+                "object_count": len(objects),
                 "objects": [],
                 "materials_count": len(bpy.data.materials),
             }
 
             # Collect minimal object information (limit to first 10 objects)
-            for i, obj in enumerate(bpy.context.scene.objects):
-                if i >= 10:  # Reduced from 20 to 10
-                    break
-
+            for obj in objects[:10]:  # Reduced from 20 to 10
                 obj_info = {
                     "name": obj.name,
                     "type": obj.type,
                     # Only include basic location data
-                    "location": [
-                        round(float(obj.location.x), 2),
-                        round(float(obj.location.y), 2),
-                        round(float(obj.location.z), 2),
-                    ],
+                    "location": [round(v, 2) for v in obj.location],
                 }
                 scene_info["objects"].append(obj_info)
 
-            print(f"Scene info collected: {len(scene_info['objects'])} objects")
+            logger.debug("Scene info collected: %d objects", len(scene_info["objects"]))
             return scene_info
         except Exception as e:
             print(f"Error in get_scene_info: {str(e)}")
@@ -370,17 +1382,18 @@ class BlenderMCPServer(SocketBlenderMCPServer):
         if obj.type != "MESH":
             raise TypeError("Object must be a mesh")
 
-        # Get the bounding box corners in local space
-        local_bbox_corners = [mathutils.Vector(corner) for corner in obj.bound_box]
+        # Imported here so enabling the add-on doesn't pay numpy's import cost
+        import numpy as np
 
-        # Convert to world coordinates
-        world_bbox_corners = [obj.matrix_world @ corner for corner in local_bbox_corners]
+        # Homogeneous local-space corners, shape (8, 4)
+        corners = np.ones((8, 4))
+        corners[:, :3] = obj.bound_box
 
-        # Compute axis-aligned min/max coordinates
-        min_corner = mathutils.Vector(map(min, zip(*world_bbox_corners)))
-        max_corner = mathutils.Vector(map(max, zip(*world_bbox_corners)))
+        # Convert all corners to world coordinates in one matrix product
+        world = (corners @ np.asarray(obj.matrix_world).T)[:, :3]
 
-        return [[*min_corner], [*max_corner]]
+        # Compute axis-aligned min/max coordinates
+        return [world.min(axis=0).tolist(), world.max(axis=0).tolist()]
 
     def get_object_info(self, name):
         """Get detailed information about a specific object"""
@@ -389,33 +1402,27 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             raise ValueError(f"Object not found: {name}")
 
         # Basic object info
+        obj_type = obj.type
         obj_info = {
             "name": obj.name,
-            "type": obj.type,
-            "location": [obj.location.x, obj.location.y, obj.location.z],
-            "rotation": [obj.rotation_euler.x, obj.rotation_euler.y, obj.rotation_euler.z],
-            "scale": [obj.scale.x, obj.scale.y, obj.scale.z],
+            "type": obj_type,
+            "location": [*obj.location],
+            "rotation": [*obj.rotation_euler],
+            "scale": [*obj.scale],
             "visible": obj.visible_get(),
-            "materials": [],
+            "materials": [slot.material.name for slot in obj.material_slots if slot.material],
         }
 
-        if obj.type == "MESH":
-            bounding_box = self._get_aabb(obj)
-            obj_info["world_bounding_box"] = bounding_box
-
-        # Add material slots
-        for slot in obj.material_slots:
-            if slot.material:
-                obj_info["materials"].append(slot.material.name)
-
-        # Add mesh data if applicable
-        if obj.type == "MESH" and obj.data:
+        # Bounding box and mesh stats only apply to meshes
+        if obj_type == "MESH":
+            obj_info["world_bounding_box"] = self._get_aabb(obj)
             mesh = obj.data
-            obj_info["mesh"] = {
-                "vertices": len(mesh.vertices),
-                "edges": len(mesh.edges),
-                "polygons": len(mesh.polygons),
-            }
+            if mesh:
+                obj_info["mesh"] = {
+                    "vertices": len(mesh.vertices),
+                    "edges": len(mesh.edges),
+                    "polygons": len(mesh.polygons),
+                }
 
         return obj_info
 
@@ -448,7 +1455,16 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             with bpy.context.temp_override(area=area):
                 bpy.ops.screen.screenshot_area(filepath=filepath)
 
-            # Load and resize if needed
+            # Only load the image into Blender when it has to be resized
+            size = _read_image_size(filepath)
+            if size and max(size) <= max_size:
+                width, height = size
+                return {"success": True, "width": width, "height": height, "filepath": filepath}
+
+            if PIL_AVAILABLE:
+                width, height = _resize_image_file(filepath, max_size, format)
+                return {"success": True, "width": width, "height": height, "filepath": filepath}
+
             img = bpy.data.images.load(filepath)
             width, height = img.size
 
@@ -481,28 +1497,32 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             # Capture stdout during execution, and return it as result
             capture_buffer = io.StringIO()
             with redirect_stdout(capture_buffer):
-                exec(code, namespace)
+                exec(_compile_code(code), namespace)
 
             captured_output = capture_buffer.getvalue()
             return {"executed": True, "result": captured_output}
         except Exception as e:
             raise Exception(f"Code execution error: {str(e)}")
 
+    def clear_asset_cache(self):
+        """Delete all cached asset downloads"""
+        return {"deleted": _asset_cache.clear()}
+
     def get_polyhaven_categories(self, asset_type):
         """Get categories for a specific asset type from Polyhaven"""
         try:
-            if asset_type not in ["hdris", "textures", "models", "all"]:
+            if asset_type not in POLYHAVEN_CATEGORY_TYPES:
                 return {
                     "error": f"Invalid asset type: {asset_type}. Must be one of: hdris, textures, models, all"
                 }
 
-            response = requests.get(
-                f"https://api.polyhaven.com/categories/{asset_type}", headers=REQ_HEADERS
+            status, categories = _polyhaven_get_json(
+                f"https://api.polyhaven.com/categories/{asset_type}", ttl=POLYHAVEN_CATEGORIES_TTL
             )
-            if response.status_code == 200:
-                return {"categories": response.json()}
+            if status == 200:
+                return {"categories": categories}
             else:
-                return {"error": f"API request failed with status code {response.status_code}"}
+                return {"error": f"API request failed with status code {status}"}
         except Exception as e:
             return {"error": str(e)}
 
@@ -513,7 +1533,7 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             params = {}
 
             if asset_type and asset_type != "all":
-                if asset_type not in ["hdris", "textures", "models"]:
+                if asset_type not in POLYHAVEN_ASSET_TYPES:
                     return {
                         "error": f"Invalid asset type: {asset_type}. Must be one of: hdris, textures, models, all"
                     }
@@ -522,16 +1542,11 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             if categories:
                 params["categories"] = categories
 
-            response = requests.get(url, params=params, headers=REQ_HEADERS)
-            if response.status_code == 200:
+            status, assets = _polyhaven_get_json(url, params=params)
+            if status == 200:
                 # Limit the response size to avoid overwhelming Blender
-                assets = response.json()
                 # Return only the first 20 assets to keep response size manageable
-                limited_assets = {}
-                for i, (key, value) in enumerate(assets.items()):
-                    if i >= 20:  # Limit to 20 assets
-                        break
-                    limited_assets[key] = value
+                limited_assets = dict(itertools.islice(assets.items(), 20))
 
                 return {
                     "assets": limited_assets,
@@ -539,20 +1554,16 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                     "returned_count": len(limited_assets),
                 }
             else:
-                return {"error": f"API request failed with status code {response.status_code}"}
+                return {"error": f"API request failed with status code {status}"}
         except Exception as e:
             return {"error": str(e)}
 
     def download_polyhaven_asset(self, asset_id, asset_type, resolution="1k", file_format=None):
         try:
             # First get the files information
-            files_response = requests.get(
-                f"https://api.polyhaven.com/files/{asset_id}", headers=REQ_HEADERS
-            )
-            if files_response.status_code != 200:
-                return {"error": f"Failed to get asset files: {files_response.status_code}"}
-
-            files_data = files_response.json()
+            status, files_data = _polyhaven_get_json(f"https://api.polyhaven.com/files/{asset_id}")
+            if status != 200:
+                return {"error": f"Failed to get asset files: {status}"}
 
             # Handle different asset types
             if asset_type == "hdris":
@@ -568,41 +1579,36 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                     file_info = files_data["hdri"][resolution][file_format]
                     file_url = file_info["url"]
 
-                    # For HDRIs, we need to save to a temporary file first
-                    # since Blender can't properly load HDR data directly from memory
-                    tmp_file = tempfile.NamedTemporaryFile(suffix=f".{file_format}", delete=False)
-                    tmp_path = tmp_file.name
-                    tmp_file.close()
+                    # HDRIs are loaded from a file, since Blender can't properly load
+                    # HDR data directly from memory; use the cached copy if there is one
+                    cache_variant = f"{resolution}.{file_format}"
+                    image_path = _asset_cache.get(asset_id, asset_type, cache_variant)
+                    if image_path is None:
+                        # Stream next to the cache so storing the download is a rename
+                        # rather than a copy
+                        part_file = tempfile.NamedTemporaryFile(
+                            dir=_asset_cache.tmp_dir, suffix=".part", delete=False
+                        )
+                        part_path = part_file.name
+                        try:
+                            # Download the file with progress tracking (MP-02)
+                            operation_id = f"polyhaven_hdri_{asset_id}_{resolution}"
+                            with part_file, _polyhaven_session().get(file_url, stream=True) as response:
+                                if response.status_code != 200:
+                                    return {"error": f"Failed to download HDRI: {response.status_code}"}
+                                # Written once front to back, then read the same way by the loader
+                                _advise_sequential(part_file)
+                                for chunk in _tracked_chunks(response, operation_id):
+                                    part_file.write(chunk)
+                            image_path = _asset_cache.put(
+                                asset_id, asset_type, part_path, cache_variant, move=True
+                            )
+                        finally:
+                            if image_path != part_path:
+                                with suppress(FileNotFoundError):
+                                    os.unlink(part_path)
 
                     try:
-                        # Download the file with progress tracking (MP-02)
-                        operation_id = f"polyhaven_hdri_{asset_id}_{resolution}"
-
-                        response = requests.get(file_url, headers=REQ_HEADERS, stream=True)
-                        if response.status_code != 200:
-                            return {"error": f"Failed to download HDRI: {response.status_code}"}
-
-                        # Get total size and start progress tracking
-                        total_size = int(response.headers.get("content-length", 0))
-                        downloaded = 0
-
-                        if PROGRESS_AVAILABLE:
-                            tracker = get_progress_tracker()
-                            if tracker:
-                                tracker.start_operation(operation_id, total_size)
-
-                        # Download with streaming and progress updates
-                        with open(tmp_path, "wb") as f:
-                            for chunk in response.iter_content(chunk_size=8192):
-                                if chunk:
-                                    f.write(chunk)
-                                    downloaded += len(chunk)
-                                    if PROGRESS_AVAILABLE and tracker:
-                                        tracker.update_progress(operation_id, downloaded)
-
-                        if PROGRESS_AVAILABLE and tracker:
-                            tracker.complete_operation(operation_id)
-
                         # Create a new world if none exists
                         if not bpy.data.worlds:
                             bpy.data.worlds.new("World")
@@ -611,53 +1617,35 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                         world.use_nodes = True
                         node_tree = world.node_tree
 
-                        # Clear existing nodes
-                        for node in node_tree.nodes:
-                            node_tree.nodes.remove(node)
-
-                        # Create nodes
-                        tex_coord = node_tree.nodes.new(type="ShaderNodeTexCoord")
-                        tex_coord.location = (-800, 0)
-
-                        mapping = node_tree.nodes.new(type="ShaderNodeMapping")
-                        mapping.location = (-600, 0)
-
-                        # Load the image from the temporary file
-                        env_tex = node_tree.nodes.new(type="ShaderNodeTexEnvironment")
-                        env_tex.location = (-400, 0)
-                        env_tex.image = bpy.data.images.load(tmp_path)
-
-                        # Use a color space that exists in all Blender versions
-                        if file_format.lower() == "exr":
-                            # Try to use Linear color space for EXR files
-                            try:
-                                env_tex.image.colorspace_settings.name = "Linear"
-                            except Exception:
-                                # Fallback to Non-Color if Linear isn't available
-                                env_tex.image.colorspace_settings.name = "Non-Color"
-                        else:  # hdr
-                            # For HDR files, try these options in order
-                            for color_space in ["Linear", "Linear Rec.709", "Non-Color"]:
-                                try:
-                                    env_tex.image.colorspace_settings.name = color_space
-                                    break  # Stop if we successfully set a color space
-                                except Exception:
-                                    continue
-
-                        background = node_tree.nodes.new(type="ShaderNodeBackground")
-                        background.location = (-200, 0)
-
-                        output = node_tree.nodes.new(type="ShaderNodeOutputWorld")
-                        output.location = (0, 0)
-
-                        # Connect nodes
-                        node_tree.links.new(
-                            tex_coord.outputs["Generated"], mapping.inputs["Vector"]
-                        )
-                        node_tree.links.new(mapping.outputs["Vector"], env_tex.inputs["Vector"])
-                        node_tree.links.new(env_tex.outputs["Color"], background.inputs["Color"])
-                        node_tree.links.new(
-                            background.outputs["Background"], output.inputs["Surface"]
+                        # Load the image from the cache and pack it: the cache file can
+                        # be expired or cleared at any time, but the scene must keep it
+                        image = bpy.data.images.load(image_path)
+                        image.pack()
+                        # pack() has read the whole file; the cached copy is not read
+                        # again until a later import, so don't keep it in page cache
+                        _drop_page_cache(image_path)
+                        image.name = f"{asset_id}_{resolution}"
+
+                        # Use a color space that exists in this Blender version
+                        kind = "exr" if file_format.lower() == "exr" else "hdr"
+                        _set_colorspace(image, kind)
+
+                        # Replace existing nodes with the environment texture setup
+                        _build_node_graph(
+                            node_tree,
+                            (
+                                ("tex_coord", "ShaderNodeTexCoord", (-800, 0), {}),
+                                ("mapping", "ShaderNodeMapping", (-600, 0), {}),
+                                ("env_tex", "ShaderNodeTexEnvironment", (-400, 0), {"image": image}),
+                                ("background", "ShaderNodeBackground", (-200, 0), {}),
+                                ("output", "ShaderNodeOutputWorld", (0, 0), {}),
+                            ),
+                            (
+                                ("tex_coord", "Generated", "mapping", "Vector"),
+                                ("mapping", "Vector", "env_tex", "Vector"),
+                                ("env_tex", "Color", "background", "Color"),
+                                ("background", "Background", "output", "Surface"),
+                            ),
                         )
 
                         # Set as active world
@@ -666,19 +1654,10 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                         return {
                             "success": True,
                             "message": f"HDRI {asset_id} imported successfully",
-                            "image_name": env_tex.image.name,
+                            "image_name": image.name,
                         }
                     except Exception as e:
                         return {"error": f"Failed to set up HDRI in Blender: {str(e)}"}
-                    finally:
-                        # CRITICAL: Always cleanup temporary file, even if there was an error
-                        try:
-                            if os.path.exists(tmp_path):
-                                os.unlink(tmp_path)
-                        except Exception as cleanup_error:
-                            print(
-                                f"Warning: Failed to cleanup temp file {tmp_path}: {cleanup_error}"
-                            )
                 else:
                     return {"error": "Requested resolution or format not available for this HDRI"}
 
@@ -689,6 +1668,7 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                 downloaded_maps = {}
 
                 try:
+                    tasks = []
                     for map_type in files_data:
                         if map_type not in ["blend", "gltf"]:  # Skip non-texture files
                             if (
@@ -696,82 +1676,41 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                                 and file_format in files_data[map_type][resolution]
                             ):
                                 file_info = files_data[map_type][resolution][file_format]
-                                file_url = file_info["url"]
+                                # Download with progress tracking (MP-02)
+                                operation_id = f"polyhaven_tex_{asset_id}_{map_type}_{resolution}"
+                                tasks.append((map_type, operation_id, file_info["url"]))
+
+                    # Maps are independent downloads; fetch them concurrently and keep
+                    # them in memory, since they are packed into the .blend anyway.
+                    with ThreadPoolExecutor(max_workers=POLYHAVEN_DOWNLOAD_WORKERS) as pool:
+                        futures = [
+                            (map_type, pool.submit(_fetch_polyhaven_map, operation_id, file_url))
+                            for map_type, operation_id, file_url in tasks
+                        ]
+
+                    # Blender data is not thread-safe: build images on this thread
+                    for map_type, future in futures:
+                        data = future.result()
+                        if data is None:
+                            continue
+
+                        # Create a packed image straight from the downloaded bytes
+                        image = bpy.data.images.new(f"{asset_id}_{map_type}.{file_format}", 8, 8)
+                        image.pack(data=data, data_len=len(data))
+                        image.source = "FILE"
 
-                                # Use NamedTemporaryFile to create temp file
-                                tmp_file = tempfile.NamedTemporaryFile(
-                                    suffix=f".{file_format}", delete=False
-                                )
-                                tmp_path = tmp_file.name
-                                tmp_file.close()
-
-                                try:
-                                    # Download the file with progress tracking (MP-02)
-                                    operation_id = (
-                                        f"polyhaven_tex_{asset_id}_{map_type}_{resolution}"
-                                    )
-
-                                    response = requests.get(
-                                        file_url, headers=REQ_HEADERS, stream=True
-                                    )
-                                    if response.status_code == 200:
-                                        # Get total size and start progress tracking
-                                        total_size = int(response.headers.get("content-length", 0))
-                                        downloaded = 0
-
-                                        if PROGRESS_AVAILABLE:
-                                            tracker = get_progress_tracker()
-                                            if tracker:
-                                                tracker.start_operation(operation_id, total_size)
-
-                                        # Download with streaming
-                                        with open(tmp_path, "wb") as f:
-                                            for chunk in response.iter_content(chunk_size=8192):
-                                                if chunk:
-                                                    f.write(chunk)
-                                                    downloaded += len(chunk)
-                                                    if PROGRESS_AVAILABLE and tracker:
-                                                        tracker.update_progress(
-                                                            operation_id, downloaded
-                                                        )
-
-                                        if PROGRESS_AVAILABLE and tracker:
-                                            tracker.complete_operation(operation_id)
-
-                                        # Load image from temporary file
-                                        image = bpy.data.images.load(tmp_path)
-                                        image.name = f"{asset_id}_{map_type}.{file_format}"
-
-                                        # Pack the image into .blend file
-                                        image.pack()
-
-                                        # Set color space based on map type
-                                        if map_type in ["color", "diffuse", "albedo"]:
-                                            try:
-                                                image.colorspace_settings.name = "sRGB"
-                                            except Exception:
-                                                pass
-                                        else:
-                                            try:
-                                                image.colorspace_settings.name = "Non-Color"
-                                            except Exception:
-                                                pass
-
-                                        downloaded_maps[map_type] = image
-                                finally:
-                                    # CRITICAL: Always cleanup temporary file
-                                    try:
-                                        if os.path.exists(tmp_path):
-                                            os.unlink(tmp_path)
-                                    except Exception as cleanup_error:
-                                        print(
-                                            f"Warning: Failed to cleanup temp file {tmp_path}: {cleanup_error}"
-                                        )
+                        # Set color space based on map type
+                        _set_colorspace(image, _texture_colorspace(map_type))
+
+                        downloaded_maps[map_type] = image
 
                     if not downloaded_maps:
                         return {
                             "error": "No texture maps found for the requested resolution and format"
                         }
+                    self._texture_images[asset_id] = [
+                        image.name for image in downloaded_maps.values()
+                    ]
 
                     # Create a new material with the downloaded textures
                     mat = bpy.data.materials.new(name=asset_id)
@@ -779,75 +1718,17 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                     nodes = mat.node_tree.nodes
                     links = mat.node_tree.links
 
-                    # Clear default nodes
-                    for node in nodes:
-                        nodes.remove(node)
-
-                    # Create output node
-                    output = nodes.new(type="ShaderNodeOutputMaterial")
-                    output.location = (300, 0)
-
-                    # Create principled BSDF node
-                    principled = nodes.new(type="ShaderNodeBsdfPrincipled")
-                    principled.location = (0, 0)
-                    links.new(principled.outputs[0], output.inputs[0])
-
-                    # Add texture nodes based on available maps
-                    tex_coord = nodes.new(type="ShaderNodeTexCoord")
-                    tex_coord.location = (-800, 0)
-
-                    mapping = nodes.new(type="ShaderNodeMapping")
-                    mapping.location = (-600, 0)
-                    mapping.vector_type = "TEXTURE"  # Changed from default 'POINT' to 'TEXTURE'
-                    links.new(tex_coord.outputs["UV"], mapping.inputs["Vector"])
-
-                    # Position offset for texture nodes
-                    x_pos = -400
-                    y_pos = 300
-
-                    # Connect different texture maps
-                    for map_type, image in downloaded_maps.items():
-                        tex_node = nodes.new(type="ShaderNodeTexImage")
-                        tex_node.location = (x_pos, y_pos)
-                        tex_node.image = image
-
-                        # Set color space based on map type
-                        if map_type.lower() in ["color", "diffuse", "albedo"]:
-                            try:
-                                tex_node.image.colorspace_settings.name = "sRGB"
-                            except Exception:
-                                pass  # Use default if sRGB not available
-                        else:
-                            try:
-                                tex_node.image.colorspace_settings.name = "Non-Color"
-                            except Exception:
-                                pass  # Use default if Non-Color not available
-
-                        links.new(mapping.outputs["Vector"], tex_node.inputs["Vector"])
-
-                        # Connect to appropriate input on Principled BSDF
-                        if map_type.lower() in ["color", "diffuse", "albedo"]:
-                            links.new(tex_node.outputs["Color"], principled.inputs["Base Color"])
-                        elif map_type.lower() in ["roughness", "rough"]:
-                            links.new(tex_node.outputs["Color"], principled.inputs["Roughness"])
-                        elif map_type.lower() in ["metallic", "metalness", "metal"]:
-                            links.new(tex_node.outputs["Color"], principled.inputs["Metallic"])
-                        elif map_type.lower() in ["normal", "nor"]:
-                            # Add normal map node
-                            normal_map = nodes.new(type="ShaderNodeNormalMap")
-                            normal_map.location = (x_pos + 200, y_pos)
-                            links.new(tex_node.outputs["Color"], normal_map.inputs["Color"])
-                            links.new(normal_map.outputs["Normal"], principled.inputs["Normal"])
-                        elif map_type in ["displacement", "disp", "height"]:
-                            # Add displacement node
-                            disp_node = nodes.new(type="ShaderNodeDisplacement")
-                            disp_node.location = (x_pos + 200, y_pos - 200)
-                            links.new(tex_node.outputs["Color"], disp_node.inputs["Height"])
-                            links.new(
-                                disp_node.outputs["Displacement"], output.inputs["Displacement"]
-                            )
+                    # Replace default nodes with Principled BSDF and UV mapping
+                    mapping, principled, output = _build_texture_material_base(
+                        mat, output_x=300, principled_x=0
+                    )
 
-                        y_pos -= 250
+                    # Connect different texture maps, laid out in one column
+                    locations = _texture_node_locations(len(downloaded_maps))
+                    for (map_type, image), location in zip(downloaded_maps.items(), locations):
+                        _wire_texture_map(
+                            nodes, links, mapping, principled, output, map_type, image, location
+                        )
 
                     return {
                         "success": True,
@@ -869,24 +1750,28 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                     file_url = file_info["url"]
 
                     # Create a temporary directory to store the model and its dependencies
-                    temp_dir = tempfile.mkdtemp()
+                    temp_dir = tempfile.mkdtemp(dir=_blender_tempdir())
                     main_file_path = ""
 
                     try:
                         # Download the main model file
                         main_file_name = file_url.split("/")[-1]
                         main_file_path = os.path.join(temp_dir, main_file_name)
-
-                        response = requests.get(file_url, headers=REQ_HEADERS)
-                        if response.status_code != 200:
-                            return {"error": f"Failed to download model: {response.status_code}"}
-
-                        with open(main_file_path, "wb") as f:
-                            f.write(response.content)
-
-                        # Check for included files and download them
-                        if "include" in file_info and file_info["include"]:
-                            for include_path, include_info in file_info["include"].items():
+                        variant = f"{resolution}.{file_format}"
+
+                        # The main file and its includes are independent: fetch them
+                        # as one concurrent batch over the pooled keep-alive session
+                        with ThreadPoolExecutor(max_workers=POLYHAVEN_DOWNLOAD_WORKERS) as pool:
+                            main_future = pool.submit(
+                                _fetch_polyhaven_file,
+                                asset_id,
+                                asset_type,
+                                variant,
+                                file_url,
+                                main_file_path,
+                            )
+                            futures = {}
+                            for include_path, include_info in (file_info.get("include") or {}).items():
                                 # Get the URL for the included file - this is the fix
                                 include_url = include_info["url"]
 
@@ -894,15 +1779,25 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                                 include_file_path = os.path.join(temp_dir, include_path)
                                 os.makedirs(os.path.dirname(include_file_path), exist_ok=True)
 
-                                # Download the included file
-                                include_response = requests.get(include_url, headers=REQ_HEADERS)
-                                if include_response.status_code == 200:
-                                    with open(include_file_path, "wb") as f:
-                                        f.write(include_response.content)
-                                else:
-                                    print(f"Failed to download included file: {include_path}")
+                                futures[include_path] = pool.submit(
+                                    _fetch_polyhaven_file,
+                                    asset_id,
+                                    asset_type,
+                                    f"{variant}/{include_path}",
+                                    include_url,
+                                    include_file_path,
+                                )
+
+                        status = main_future.result()
+                        if status != 200:
+                            return {"error": f"Failed to download model: {status}"}
+
+                        for include_path, future in futures.items():
+                            if future.result() != 200:
+                                logger.warning("Failed to download included file: %s", include_path)
 
                         # Import the model into Blender
+                        existing_objects = set(bpy.data.objects.keys())
                         if file_format == "gltf" or file_format == "glb":
                             bpy.ops.import_scene.gltf(filepath=main_file_path)
                         elif file_format == "fbx":
@@ -924,8 +1819,11 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                         else:
                             return {"error": f"Unsupported model format: {file_format}"}
 
-                        # Get the names of imported objects
-                        imported_objects = [obj.name for obj in bpy.context.selected_objects]
+                        # Get the names of imported objects; appended .blend objects
+                        # are not selected, so diff the object names instead
+                        imported_objects = [
+                            name for name in bpy.data.objects.keys() if name not in existing_objects
+                        ]
 
                         return {
                             "success": True,
@@ -936,8 +1834,7 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                         return {"error": f"Failed to import model: {str(e)}"}
                     finally:
                         # Clean up temporary directory
-                        with suppress(Exception):
-                            shutil.rmtree(temp_dir)
+                        _remove_tree_later(temp_dir)
                 else:
                     return {"error": "Requested format or resolution not available for this model"}
 
@@ -947,8 +1844,36 @@ class BlenderMCPServer(SocketBlenderMCPServer):
         except Exception as e:
             return {"error": f"Failed to download asset: {str(e)}"}
 
-    def set_texture(self, object_name, texture_id):
-        """Apply a previously downloaded Polyhaven texture to an object by creating a new material"""
+    def _find_texture_images(self, texture_id):
+        """Return {lower-case map type: image} for a downloaded Polyhaven texture"""
+        found = [bpy.data.images.get(name) for name in self._texture_images.get(texture_id, ())]
+        if not found or not all(found):
+            # Not downloaded this session (or images were removed): scan by name prefix
+            prefix = texture_id + "_"
+            found = [img for img in bpy.data.images if img.name.startswith(prefix)]
+
+        # Extract the map type from the image name, normalized once to lower case
+        return {img.name.split("_")[-1].split(".")[0].lower(): img for img in found}
+
+    def _shared_texture_material(self, texture_id, texture_images):
+        """Return the material already built from exactly these images, if any"""
+        name = self._texture_materials.get(texture_id, f"{texture_id}_material")
+        material = bpy.data.materials.get(name)
+        if material is None or not material.use_nodes:
+            return None
+        used = {
+            node.image.name
+            for node in material.node_tree.nodes
+            if node.type == "TEX_IMAGE" and node.image
+        }
+        return material if used == {img.name for img in texture_images.values()} else None
+
+    def set_texture(self, object_name, texture_id, finalize=True):
+        """Apply a previously downloaded Polyhaven texture to an object by creating a new material
+
+        With finalize=False the object is neither selected nor followed by a
+        view layer update; set_textures_bulk does both once for the whole batch.
+        """
         try:
             # Get the object
             obj = bpy.data.objects.get(object_name)
@@ -960,270 +1885,50 @@ class BlenderMCPServer(SocketBlenderMCPServer):
                 return {"error": f"Object {object_name} cannot accept materials"}
 
             # Find all images related to this texture and ensure they're properly loaded
-            texture_images = {}
-            for img in bpy.data.images:
-                if img.name.startswith(texture_id + "_"):
-                    # Extract the map type from the image name
-                    map_type = img.name.split("_")[-1].split(".")[0]
-
-                    # Force a reload of the image
+            texture_images = self._find_texture_images(texture_id)
+            for map_type, img in texture_images.items():
+                # Images downloaded by this addon are packed from memory already;
+                # only refresh and pack ones that still point at a file on disk
+                if not img.packed_file:
                     img.reload()
+                    img.pack()
 
-                    # Ensure proper color space
-                    if map_type.lower() in ["color", "diffuse", "albedo"]:
-                        try:
-                            img.colorspace_settings.name = "sRGB"
-                        except Exception:
-                            pass
-                    else:
-                        try:
-                            img.colorspace_settings.name = "Non-Color"
-                        except Exception:
-                            pass
+                # Ensure proper color space
+                _set_colorspace(img, _texture_colorspace(map_type))
 
-                    # Ensure the image is packed
-                    if not img.packed_file:
-                        img.pack()
+                logger.debug("Loaded texture map: %s - %s", map_type, img.name)
 
-                    texture_images[map_type] = img
-                    print(f"Loaded texture map: {map_type} - {img.name}")
-
-                    # Debug info
-                    print(f"Image size: {img.size[0]}x{img.size[1]}")
-                    print(f"Color space: {img.colorspace_settings.name}")
-                    print(f"File format: {img.file_format}")
-                    print(f"Is packed: {bool(img.packed_file)}")
+                # Debug info; the RNA reads are skipped unless debug logging is on
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Image size: %dx%d", *img.size)
+                    logger.debug("Color space: %s", img.colorspace_settings.name)
+                    logger.debug("File format: %s", img.file_format)
+                    logger.debug("Is packed: %s", bool(img.packed_file))
 
             if not texture_images:
                 return {
                     "error": f"No texture images found for: {texture_id}. Please download the texture first."
                 }
 
-            # Create a new material
-            new_mat_name = f"{texture_id}_material_{object_name}"
-
-            # Remove any existing material with this name to avoid conflicts
-            existing_mat = bpy.data.materials.get(new_mat_name)
-            if existing_mat:
-                bpy.data.materials.remove(existing_mat)
-
-            new_mat = bpy.data.materials.new(name=new_mat_name)
-            new_mat.use_nodes = True
-
-            # Set up the material nodes
-            nodes = new_mat.node_tree.nodes
-            links = new_mat.node_tree.links
-
-            # Clear default nodes
-            nodes.clear()
-
-            # Create output node
-            output = nodes.new(type="ShaderNodeOutputMaterial")
-            output.location = (600, 0)
-
-            # Create principled BSDF node
-            principled = nodes.new(type="ShaderNodeBsdfPrincipled")
-            principled.location = (300, 0)
-            links.new(principled.outputs[0], output.inputs[0])
-
-            # Add texture nodes based on available maps
-            tex_coord = nodes.new(type="ShaderNodeTexCoord")
-            tex_coord.location = (-800, 0)
-
-            mapping = nodes.new(type="ShaderNodeMapping")
-            mapping.location = (-600, 0)
-            mapping.vector_type = "TEXTURE"  # Changed from default 'POINT' to 'TEXTURE'
-            links.new(tex_coord.outputs["UV"], mapping.inputs["Vector"])
-
-            # Position offset for texture nodes
-            x_pos = -400
-            y_pos = 300
-
-            # Connect different texture maps
-            for map_type, image in texture_images.items():
-                tex_node = nodes.new(type="ShaderNodeTexImage")
-                tex_node.location = (x_pos, y_pos)
-                tex_node.image = image
-
-                # Set color space based on map type
-                if map_type.lower() in ["color", "diffuse", "albedo"]:
-                    try:
-                        tex_node.image.colorspace_settings.name = "sRGB"
-                    except Exception:
-                        pass  # Use default if sRGB not available
-                else:
-                    try:
-                        tex_node.image.colorspace_settings.name = "Non-Color"
-                    except Exception:
-                        pass  # Use default if Non-Color not available
-
-                links.new(mapping.outputs["Vector"], tex_node.inputs["Vector"])
-
-                # Connect to appropriate input on Principled BSDF
-                if map_type.lower() in ["color", "diffuse", "albedo"]:
-                    links.new(tex_node.outputs["Color"], principled.inputs["Base Color"])
-                elif map_type.lower() in ["roughness", "rough"]:
-                    links.new(tex_node.outputs["Color"], principled.inputs["Roughness"])
-                elif map_type.lower() in ["metallic", "metalness", "metal"]:
-                    links.new(tex_node.outputs["Color"], principled.inputs["Metallic"])
-                elif map_type.lower() in ["normal", "nor", "dx", "gl"]:
-                    # Add normal map node
-                    normal_map = nodes.new(type="ShaderNodeNormalMap")
-                    normal_map.location = (x_pos + 200, y_pos)
-                    links.new(tex_node.outputs["Color"], normal_map.inputs["Color"])
-                    links.new(normal_map.outputs["Normal"], principled.inputs["Normal"])
-                elif map_type.lower() in ["displacement", "disp", "height"]:
-                    # Add displacement node
-                    disp_node = nodes.new(type="ShaderNodeDisplacement")
-                    disp_node.location = (x_pos + 200, y_pos - 200)
-                    disp_node.inputs["Scale"].default_value = 0.1  # Reduce displacement strength
-                    links.new(tex_node.outputs["Color"], disp_node.inputs["Height"])
-                    links.new(disp_node.outputs["Displacement"], output.inputs["Displacement"])
-
-                y_pos -= 250
-
-            # Second pass: Connect nodes with proper handling for special cases
-            texture_nodes = {}
-
-            # First find all texture nodes and store them by map type
-            for node in nodes:
-                if node.type == "TEX_IMAGE" and node.image:
-                    for map_type, image in texture_images.items():
-                        if node.image == image:
-                            texture_nodes[map_type] = node
-                            break
-
-            # Now connect everything using the nodes instead of images
-            # Handle base color (diffuse)
-            for map_name in ["color", "diffuse", "albedo"]:
-                if map_name in texture_nodes:
-                    links.new(
-                        texture_nodes[map_name].outputs["Color"], principled.inputs["Base Color"]
-                    )
-                    print(f"Connected {map_name} to Base Color")
-                    break
-
-            # Handle roughness
-            for map_name in ["roughness", "rough"]:
-                if map_name in texture_nodes:
-                    links.new(
-                        texture_nodes[map_name].outputs["Color"], principled.inputs["Roughness"]
-                    )
-                    print(f"Connected {map_name} to Roughness")
-                    break
-
-            # Handle metallic
-            for map_name in ["metallic", "metalness", "metal"]:
-                if map_name in texture_nodes:
-                    links.new(
-                        texture_nodes[map_name].outputs["Color"], principled.inputs["Metallic"]
-                    )
-                    print(f"Connected {map_name} to Metallic")
-                    break
-
-            # Handle normal maps
-            for map_name in ["gl", "dx", "nor"]:
-                if map_name in texture_nodes:
-                    normal_map_node = nodes.new(type="ShaderNodeNormalMap")
-                    normal_map_node.location = (100, 100)
-                    links.new(
-                        texture_nodes[map_name].outputs["Color"], normal_map_node.inputs["Color"]
-                    )
-                    links.new(normal_map_node.outputs["Normal"], principled.inputs["Normal"])
-                    print(f"Connected {map_name} to Normal")
-                    break
-
-            # Handle displacement
-            for map_name in ["displacement", "disp", "height"]:
-                if map_name in texture_nodes:
-                    disp_node = nodes.new(type="ShaderNodeDisplacement")
-                    disp_node.location = (300, -200)
-                    disp_node.inputs["Scale"].default_value = 0.1  # Reduce displacement strength
-                    links.new(texture_nodes[map_name].outputs["Color"], disp_node.inputs["Height"])
-                    links.new(disp_node.outputs["Displacement"], output.inputs["Displacement"])
-                    print(f"Connected {map_name} to Displacement")
-                    break
-
-            # Handle ARM texture (Ambient Occlusion, Roughness, Metallic)
-            if "arm" in texture_nodes:
-                separate_rgb = nodes.new(type="ShaderNodeSeparateRGB")
-                separate_rgb.location = (-200, -100)
-                links.new(texture_nodes["arm"].outputs["Color"], separate_rgb.inputs["Image"])
-
-                # Connect Roughness (G) if no dedicated roughness map
-                if not any(map_name in texture_nodes for map_name in ["roughness", "rough"]):
-                    links.new(separate_rgb.outputs["G"], principled.inputs["Roughness"])
-                    print("Connected ARM.G to Roughness")
-
-                # Connect Metallic (B) if no dedicated metallic map
-                if not any(
-                    map_name in texture_nodes for map_name in ["metallic", "metalness", "metal"]
-                ):
-                    links.new(separate_rgb.outputs["B"], principled.inputs["Metallic"])
-                    print("Connected ARM.B to Metallic")
-
-                # For AO (R channel), multiply with base color if we have one
-                base_color_node = None
-                for map_name in ["color", "diffuse", "albedo"]:
-                    if map_name in texture_nodes:
-                        base_color_node = texture_nodes[map_name]
-                        break
-
-                if base_color_node:
-                    mix_node = nodes.new(type="ShaderNodeMixRGB")
-                    mix_node.location = (100, 200)
-                    mix_node.blend_type = "MULTIPLY"
-                    mix_node.inputs["Fac"].default_value = 0.8  # 80% influence
-
-                    # Disconnect direct connection to base color
-                    for link in base_color_node.outputs["Color"].links:
-                        if link.to_socket == principled.inputs["Base Color"]:
-                            links.remove(link)
-
-                    # Connect through the mix node
-                    links.new(base_color_node.outputs["Color"], mix_node.inputs[1])
-                    links.new(separate_rgb.outputs["R"], mix_node.inputs[2])
-                    links.new(mix_node.outputs["Color"], principled.inputs["Base Color"])
-                    print("Connected ARM.R to AO mix with Base Color")
-
-            # Handle AO (Ambient Occlusion) if separate
-            if "ao" in texture_nodes:
-                base_color_node = None
-                for map_name in ["color", "diffuse", "albedo"]:
-                    if map_name in texture_nodes:
-                        base_color_node = texture_nodes[map_name]
-                        break
-
-                if base_color_node:
-                    mix_node = nodes.new(type="ShaderNodeMixRGB")
-                    mix_node.location = (100, 200)
-                    mix_node.blend_type = "MULTIPLY"
-                    mix_node.inputs["Fac"].default_value = 0.8  # 80% influence
-
-                    # Disconnect direct connection to base color
-                    for link in base_color_node.outputs["Color"].links:
-                        if link.to_socket == principled.inputs["Base Color"]:
-                            links.remove(link)
-
-                    # Connect through the mix node
-                    links.new(base_color_node.outputs["Color"], mix_node.inputs[1])
-                    links.new(texture_nodes["ao"].outputs["Color"], mix_node.inputs[2])
-                    links.new(mix_node.outputs["Color"], principled.inputs["Base Color"])
-                    print("Connected AO to mix with Base Color")
+            # Objects textured from the same maps share one material
+            new_mat = self._shared_texture_material(texture_id, texture_images)
+            if new_mat is None:
+                new_mat = _build_texture_material(f"{texture_id}_material", texture_images)
+                self._texture_materials[texture_id] = new_mat.name
 
             # CRITICAL: Make sure to clear all existing materials from the object
-            while len(obj.data.materials) > 0:
-                obj.data.materials.pop(index=0)
+            obj.data.materials.clear()
 
             # Assign the new material to the object
             obj.data.materials.append(new_mat)
 
-            # CRITICAL: Make the object active and select it
-            bpy.context.view_layer.objects.active = obj
-            obj.select_set(True)
+            if finalize:
+                # CRITICAL: Make the object active and select it
+                bpy.context.view_layer.objects.active = obj
+                obj.select_set(True)
 
-            # CRITICAL: Force Blender to update the material
-            bpy.context.view_layer.update()
+                # CRITICAL: Force Blender to update the material
+                bpy.context.view_layer.update()
 
             # Get the list of texture maps
             texture_maps = list(texture_images.keys())
@@ -1256,7 +1961,7 @@ class BlenderMCPServer(SocketBlenderMCPServer):
 
             return {
                 "success": True,
-                "message": f"Created new material and applied texture {texture_id} to {object_name}",
+                "message": f"Applied texture {texture_id} to {object_name}",
                 "material": new_mat.name,
                 "maps": texture_maps,
                 "material_info": material_info,
@@ -1267,6 +1972,30 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             traceback.print_exc()
             return {"error": f"Failed to apply texture: {str(e)}"}
 
+    def set_textures_bulk(self, assignments):
+        """Apply Polyhaven textures to several objects with a single view layer update
+
+        assignments is a list of [object_name, texture_id] pairs. Each pair is
+        applied as set_texture would; only the last textured object is made
+        active and the depsgraph is evaluated once at the end, instead of once
+        per object.
+        """
+        results = []
+        last_obj = None
+        for object_name, texture_id in assignments:
+            result = self.set_texture(object_name, texture_id, finalize=False)
+            results.append({"object_name": object_name, "texture_id": texture_id, **result})
+            if result.get("success"):
+                last_obj = bpy.data.objects[object_name]
+
+        if last_obj is not None:
+            bpy.context.view_layer.objects.active = last_obj
+            last_obj.select_set(True)
+            bpy.context.view_layer.update()
+
+        applied = sum(1 for r in results if r.get("success"))
+        return {"success": applied > 0, "applied": applied, "results": results}
+
     def get_polyhaven_status(self):
         """Get the current status of PolyHaven integration"""
         enabled = bpy.context.scene.blendermcp_use_polyhaven
@@ -1292,27 +2021,29 @@ class BlenderMCPServer(SocketBlenderMCPServer):
 
         # Test the API key if present
         if api_key:
-            try:
-                headers = {"Authorization": f"Token {api_key}"}
-
-                response = requests.get(
-                    "https://api.sketchfab.com/v3/me",
-                    headers=headers,
-                    timeout=30,  # Add timeout of 30 seconds
-                )
+            import requests
 
-                if response.status_code == 200:
-                    user_data = response.json()
+            try:
+                # Keys validated within the last day skip the /me round trip
+                username = _validated_sketchfab_username(api_key)
+                if username is None:
+                    status, user_data = _sketchfab_get_json(
+                        "https://api.sketchfab.com/v3/me", api_key, SKETCHFAB_STATUS_TTL
+                    )
+                    if status != 200:
+                        if status in (401, 403):
+                            _store_validated_key(api_key, None)
+                        return {
+                            "enabled": False,
+                            "message": f"Sketchfab API key seems invalid. Status code: {status}",
+                        }
                     username = user_data.get("username", "Unknown user")
-                    return {
-                        "enabled": True,
-                        "message": f"Sketchfab integration is enabled and ready to use. Logged in as: {username}",
-                    }
-                else:
-                    return {
-                        "enabled": False,
-                        "message": f"Sketchfab API key seems invalid. Status code: {response.status_code}",
-                    }
+                    _store_validated_key(api_key, username)
+
+                return {
+                    "enabled": True,
+                    "message": f"Sketchfab integration is enabled and ready to use. Logged in as: {username}",
+                }
             except requests.exceptions.Timeout:
                 return {
                     "enabled": False,
@@ -1347,6 +2078,8 @@ class BlenderMCPServer(SocketBlenderMCPServer):
 
     def search_sketchfab_models(self, query, categories=None, count=20, downloadable=True):
         """Search for models on Sketchfab based on query and optional filters"""
+        import requests
+
         try:
             api_key = bpy.context.scene.blendermcp_sketchfab_api_key
             if not api_key:
@@ -1364,25 +2097,16 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             if categories:
                 params["categories"] = categories
 
-            # Make API request to Sketchfab search endpoint
-            # The proper format according to Sketchfab API docs for API key auth
-            headers = {"Authorization": f"Token {api_key}"}
-
             # Use the search endpoint as specified in the API documentation
-            response = requests.get(
-                "https://api.sketchfab.com/v3/search",
-                headers=headers,
-                params=params,
-                timeout=30,  # Add timeout of 30 seconds
+            status, response_data = _sketchfab_get_json(
+                "https://api.sketchfab.com/v3/search", api_key, SKETCHFAB_SEARCH_TTL, params
             )
 
-            if response.status_code == 401:
+            if status == 401:
                 return {"error": "Authentication failed (401). Check your API key."}
 
-            if response.status_code != 200:
-                return {"error": f"API request failed with status code {response.status_code}"}
-
-            response_data = response.json()
+            if status != 200:
+                return {"error": f"API request failed with status code {status}"}
 
             # Safety check on the response structure
             if response_data is None:
@@ -1405,136 +2129,171 @@ class BlenderMCPServer(SocketBlenderMCPServer):
             traceback.print_exc()
             return {"error": str(e)}
 
-    def download_sketchfab_model(self, uid):
-        """Download a model from Sketchfab by its UID"""
-        try:
-            api_key = bpy.context.scene.blendermcp_sketchfab_api_key
-            if not api_key:
-                return {"error": "Sketchfab API key is not configured"}
-
-            # Use proper authorization header for API key auth
-            headers = {"Authorization": f"Token {api_key}"}
+    def _download_sketchfab_archive(self, uid, api_key, zip_file_path):
+        """Download a model's glTF archive to zip_file_path; return an error dict on failure"""
+        # Use proper authorization header for API key auth
+        headers = {"Authorization": f"Token {api_key}"}
 
-            # Request download URL using the exact endpoint from the documentation
-            download_endpoint = f"https://api.sketchfab.com/v3/models/{uid}/download"
-
-            response = requests.get(
-                download_endpoint, headers=headers, timeout=30  # Add timeout of 30 seconds
-            )
+        # Request download URL using the exact endpoint from the documentation
+        download_endpoint = f"https://api.sketchfab.com/v3/models/{uid}/download"
 
-            if response.status_code == 401:
-                return {"error": "Authentication failed (401). Check your API key."}
-
-            if response.status_code != 200:
-                return {"error": f"Download request failed with status code {response.status_code}"}
+        response = _sketchfab_session().get(
+            download_endpoint, headers=headers, timeout=30  # Add timeout of 30 seconds
+        )
 
-            data = response.json()
+        if response.status_code == 401:
+            return {"error": "Authentication failed (401). Check your API key."}
 
-            # Safety check for None data
-            if data is None:
-                return {"error": "Received empty response from Sketchfab API for download request"}
+        if response.status_code != 200:
+            return {"error": f"Download request failed with status code {response.status_code}"}
 
-            # Extract download URL with safety checks
-            gltf_data = data.get("gltf")
-            if not gltf_data:
-                return {
-                    "error": "No gltf download URL available for this model. Response: " + str(data)
-                }
+        data = response.json()
 
-            download_url = gltf_data.get("url")
-            if not download_url:
-                return {
-                    "error": "No download URL available for this model. Make sure the model is downloadable and you have access."
-                }
+        # Safety check for None data
+        if data is None:
+            return {"error": "Received empty response from Sketchfab API for download request"}
 
-            # Download the model with progress tracking (MP-02)
-            operation_id = f"sketchfab_{uid}"
+        # Extract download URL with safety checks
+        gltf_data = data.get("gltf")
+        if not gltf_data:
+            return {
+                "error": "No gltf download URL available for this model. Response: " + str(data)
+            }
 
-            model_response = requests.get(download_url, timeout=60, stream=True)
+        download_url = gltf_data.get("url")
+        if not download_url:
+            return {
+                "error": "No download URL available for this model. Make sure the model is downloadable and you have access."
+            }
 
-            if model_response.status_code != 200:
-                return {
-                    "error": f"Model download failed with status code {model_response.status_code}"
-                }
+        # Download the model with progress tracking (MP-02)
+        operation_id = f"sketchfab_{uid}"
 
-            # Save to temporary file with progress
-            temp_dir = tempfile.mkdtemp()
-            zip_file_path = os.path.join(temp_dir, f"{uid}.zip")
+        # The archive is already deflated; ask the CDN not to gzip it again
+        model_response = _sketchfab_session().get(
+            download_url, headers={"Accept-Encoding": "identity"}, timeout=60, stream=True
+        )
 
-            total_size = int(model_response.headers.get("content-length", 0))
-            downloaded = 0
+        if model_response.status_code != 200:
+            model_response.close()
+            return {
+                "error": f"Model download failed with status code {model_response.status_code}"
+            }
 
-            if PROGRESS_AVAILABLE:
-                tracker = get_progress_tracker()
-                if tracker:
-                    tracker.start_operation(operation_id, total_size)
-
-            with open(zip_file_path, "wb") as f:
-                for chunk in model_response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if PROGRESS_AVAILABLE and tracker:
-                            tracker.update_progress(operation_id, downloaded)
-
-            if PROGRESS_AVAILABLE and tracker:
-                tracker.complete_operation(operation_id)
-
-            # Extract the zip file with enhanced security
-            with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
-                # More secure zip slip prevention
-                for file_info in zip_ref.infolist():
-                    # Get the path of the file
-                    file_path = file_info.filename
-
-                    # Convert directory separators to the current OS style
-                    # This handles both / and \ in zip entries
-                    target_path = os.path.join(temp_dir, os.path.normpath(file_path))
-
-                    # Get absolute paths for comparison
-                    abs_temp_dir = os.path.abspath(temp_dir)
-                    abs_target_path = os.path.abspath(target_path)
-
-                    # Ensure the normalized path doesn't escape the target directory
-                    if not abs_target_path.startswith(abs_temp_dir):
-                        with suppress(Exception):
-                            shutil.rmtree(temp_dir)
-                        return {
-                            "error": "Security issue: Zip contains files with path traversal attempt"
-                        }
+        # Save to the given path with progress
+        with model_response, open(zip_file_path, "wb") as f:
+            # Written once front to back, then read back once for extraction
+            _advise_sequential(f)
+            for chunk in _tracked_chunks(model_response, operation_id):
+                f.write(chunk)
+        return None
 
-                    # Additional explicit check for directory traversal
-                    if ".." in file_path:
-                        with suppress(Exception):
-                            shutil.rmtree(temp_dir)
-                        return {
-                            "error": "Security issue: Zip contains files with directory traversal sequence"
-                        }
+    def download_sketchfab_model(self, uid):
+        """Download a model from Sketchfab by its UID"""
+        import requests
 
-                # If all files passed security checks, extract them
-                zip_ref.extractall(temp_dir)
+        try:
+            api_key = bpy.context.scene.blendermcp_sketchfab_api_key
+            if not api_key:
+                return {"error": "Sketchfab API key is not configured"}
 
-            # Find the main glTF file
-            gltf_files = [
-                f for f in os.listdir(temp_dir) if f.endswith(".gltf") or f.endswith(".glb")
-            ]
+            # Re-imports of a model are served from the asset cache without any
+            # API or CDN round trip; only the extracted copy is temporary
+            temp_dir = tempfile.mkdtemp(dir=_blender_tempdir())
+            zip_file_path = _asset_cache.get(uid, "sketchfab", "gltf.zip")
+            downloaded = zip_file_path is None
+            if downloaded:
+                # Download next to the cache so storing the archive is a rename
+                # rather than a copy
+                fd, zip_file_path = tempfile.mkstemp(dir=_asset_cache.tmp_dir, suffix=".part")
+                os.close(fd)
+            cache_thread = None
+            try:
+                if downloaded:
+                    error = self._download_sketchfab_archive(uid, api_key, zip_file_path)
+                    if error:
+                        _remove_tree_later(temp_dir)
+                        return error
+
+                # Extract the zip file with enhanced security: validate every entry in
+                # one pass over the central directory, then inflate them concurrently
+                abs_temp_dir = os.path.abspath(temp_dir)
+                extract_root = abs_temp_dir + os.sep
+                entries = []
+                with zipfile.ZipFile(zip_file_path, "r") as zip_ref:
+                    for file_info in zip_ref.infolist():
+                        # Get the path of the file
+                        file_path = file_info.filename
+
+                        # Normalizing resolves ".." components and converts directory
+                        # separators to the current OS style (handles both / and \)
+                        target_path = os.path.normpath(os.path.join(abs_temp_dir, file_path))
+
+                        # Ensure the normalized path doesn't escape the target directory;
+                        # this covers "..", absolute paths and drive letters alike
+                        if target_path != abs_temp_dir and not target_path.startswith(extract_root):
+                            _remove_tree_later(temp_dir)
+                            return {
+                                "error": "Security issue: Zip contains files with path traversal attempt"
+                            }
+
+                        if file_info.is_dir():
+                            os.makedirs(target_path, exist_ok=True)
+                            continue
+
+                        os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                        if file_info.file_size:
+                            entries.append((file_info, target_path))
+                        else:
+                            # Empty entries only need the file created
+                            open(target_path, "wb").close()
+
+                # Entries are CRC-checked every time, so a damaged cached archive
+                # fails here instead of importing a corrupt model
+                _extract_zip_entries(zip_file_path, entries)
+                if downloaded:
+                    # The archive passed validation; move it into the cache for later
+                    # imports while Blender imports the extracted model
+                    cache_thread = threading.Thread(
+                        target=_asset_cache.put,
+                        args=(uid, "sketchfab", zip_file_path, "gltf.zip"),
+                        kwargs={"move": True},
+                        daemon=True,
+                    )
+                    cache_thread.start()
+            finally:
+                # Anything short of handing the archive to the cache discards it
+                if downloaded and cache_thread is None:
+                    with suppress(FileNotFoundError):
+                        os.unlink(zip_file_path)
+            if not downloaded:
+                # A cached archive is not read again until the next re-import; leave
+                # the page cache to the model import that follows
+                _drop_page_cache(zip_file_path)
+
+            # Find the main glTF file, stopping at the first match
+            main_file = None
+            with os.scandir(temp_dir) as it:
+                for entry in it:
+                    if entry.name.endswith((".gltf", ".glb")) and entry.is_file():
+                        main_file = entry.path
+                        break
 
-            if not gltf_files:
-                with suppress(Exception):
-                    shutil.rmtree(temp_dir)
+            if main_file is None:
+                _remove_tree_later(temp_dir)
                 return {"error": "No glTF file found in the downloaded model"}
 
-            main_file = os.path.join(temp_dir, gltf_files[0])
-
             # Import the model
+            existing_objects = set(bpy.data.objects.keys())
             bpy.ops.import_scene.gltf(filepath=main_file)
 
             # Get the names of imported objects
-            imported_objects = [obj.name for obj in bpy.context.selected_objects]
+            imported_objects = [
+                name for name in bpy.data.objects.keys() if name not in existing_objects
+            ]
 
             # Clean up temporary files
-            with suppress(Exception):
-                shutil.rmtree(temp_dir)
+            _remove_tree_later(temp_dir)
 
             return {
                 "success": True,
@@ -1627,7 +2386,7 @@ class BLENDERMCP_PT_Panel(bpy.types.Panel):
         layout.separator()
         cache_box = layout.box()
         cache_box.label(text="Asset Cache", icon="FILE_CACHE")
-        cache_size, file_count = _asset_cache.get_cache_size()
+        cache_size, file_count = _asset_cache.get_cache_size(max_age=CACHE_SIZE_DISPLAY_TTL)
         size_mb = cache_size / (1024 * 1024)
         cache_box.label(text=f"Files: {file_count}, Size: {size_mb:.1f} MB")
         cache_box.operator("blendermcp.clear_cache", text="Clear Cache", icon="TRASH")
@@ -1796,8 +2555,8 @@ class BLENDERMCP_OT_OpenLogs(bpy.types.Operator):
     def execute(self, context):
         try:
             path = _logs_path()
-            if not os.path.exists(path):
-                open(path, "a", encoding="utf-8").close()
+            # Append mode creates a missing file and leaves an existing one as is
+            open(path, "a", encoding="utf-8").close()
             _open_in_system(path)
         except Exception as exc:
             self.report({"ERROR"}, f"Could not open logs: {exc}")
@@ -1938,6 +2697,22 @@ class BLENDERMCP_OT_DownloadProgress(bpy.types.Operator):
 
 
 # Registration functions
+_classes = (
+    BLENDERMCP_PT_Panel,
+    BLENDERMCP_OT_StartServer,
+    BLENDERMCP_OT_StopServer,
+    BLENDERMCP_OT_InstallDependencies,
+    BLENDERMCP_OT_RunMCPServerTerminal,
+    BLENDERMCP_OT_CopyMCPClientConfig,
+    BLENDERMCP_OT_HealthCheck,
+    BLENDERMCP_OT_OpenLogs,
+    BLENDERMCP_OT_ClearCache,
+    BLENDERMCP_OT_DownloadProgress,
+)
+# Registers in order and unregisters in reverse, so the panel goes away last
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
+
+
 def register():
     bpy.types.Scene.blendermcp_port = IntProperty(
         name="Port",
@@ -1999,16 +2774,7 @@ def register():
         default=True,
     )
 
-    bpy.utils.register_class(BLENDERMCP_PT_Panel)
-    bpy.utils.register_class(BLENDERMCP_OT_StartServer)
-    bpy.utils.register_class(BLENDERMCP_OT_StopServer)
-    bpy.utils.register_class(BLENDERMCP_OT_InstallDependencies)
-    bpy.utils.register_class(BLENDERMCP_OT_RunMCPServerTerminal)
-    bpy.utils.register_class(BLENDERMCP_OT_CopyMCPClientConfig)
-    bpy.utils.register_class(BLENDERMCP_OT_HealthCheck)
-    bpy.utils.register_class(BLENDERMCP_OT_OpenLogs)
-    bpy.utils.register_class(BLENDERMCP_OT_ClearCache)
-    bpy.utils.register_class(BLENDERMCP_OT_DownloadProgress)
+    _register_classes()
 
     print("BlenderMCP addon registered")
 
@@ -2019,16 +2785,7 @@ def unregister():
         bpy.types.blendermcp_server.stop()
         del bpy.types.blendermcp_server
 
-    bpy.utils.unregister_class(BLENDERMCP_PT_Panel)
-    bpy.utils.unregister_class(BLENDERMCP_OT_StartServer)
-    bpy.utils.unregister_class(BLENDERMCP_OT_StopServer)
-    bpy.utils.unregister_class(BLENDERMCP_OT_InstallDependencies)
-    bpy.utils.unregister_class(BLENDERMCP_OT_RunMCPServerTerminal)
-    bpy.utils.unregister_class(BLENDERMCP_OT_CopyMCPClientConfig)
-    bpy.utils.unregister_class(BLENDERMCP_OT_HealthCheck)
-    bpy.utils.unregister_class(BLENDERMCP_OT_OpenLogs)
-    bpy.utils.unregister_class(BLENDERMCP_OT_ClearCache)
-    bpy.utils.unregister_class(BLENDERMCP_OT_DownloadProgress)
+    _unregister_classes()
 
     del bpy.types.Scene.blendermcp_port
     del bpy.types.Scene.blendermcp_server_running
@@ -2041,6 +2798,8 @@ def unregister():
     del bpy.types.Scene.blendermcp_last_action_details
     del bpy.types.Scene.blendermcp_last_action_ok
 
+    _close_sessions()
+
     print("BlenderMCP addon unregistered")
 
 
@@ -1,10 +1,76 @@
 """Asset caching system for BlenderMCP (MP-05)."""
 
+import errno
+import functools
+import hashlib
+import json
 import os
 import shutil
+import sqlite3
+import threading
 import time
+from collections import OrderedDict
+from contextlib import suppress
 
-from .constants import CACHE_DIR, CACHE_TTL_DAYS
+from .constants import (
+    CACHE_DIR,
+    CACHE_HIT_ENTRIES,
+    CACHE_INDEX_NAME,
+    CACHE_META_DIR,
+    CACHE_SWEEP_INTERVAL,
+    CACHE_TMP_DIR,
+    CACHE_TTL_DAYS,
+)
+
+# copy_file_range failures that mean "use a regular copy instead"
+_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.ENOSYS, errno.EXDEV, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM, errno.EBADF}
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _cache_key_hash(asset_id: str, asset_type: str, resolution: str) -> str:
+    """Hash asset identifiers into a filename-safe cache key."""
+    cache_key = f"{asset_id}_{asset_type}_{resolution}"
+    # Not a security boundary: BLAKE2b-128 is cheaper than SHA-256 and
+    # yields shorter filenames.
+    return hashlib.blake2b(cache_key.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _copy_file(source_path: str, dest_path: str) -> None:
+    """Copy a file and its metadata, letting the kernel move the bytes when possible.
+
+    Uses os.copy_file_range (Linux) so same-filesystem copies can be reflinked or
+    done in-kernel, and falls back to shutil.copyfile where it is unsupported.
+    """
+    copied = False
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source_path, "rb") as src, open(dest_path, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    written = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if written == 0:
+                        break
+                    remaining -= written
+                copied = remaining == 0
+        except OSError as exc:
+            if exc.errno not in _COPY_FALLBACK_ERRNOS:
+                raise
+    if not copied:
+        shutil.copyfile(source_path, dest_path)
+    shutil.copystat(source_path, dest_path)
+
+
+def _move_file(source_path: str, dest_path: str) -> bool:
+    """Rename a file into place; False if it lives on another filesystem."""
+    try:
+        os.replace(source_path, dest_path)
+    except OSError as exc:
+        if exc.errno != errno.EXDEV:
+            raise
+        return False
+    return True
 
 
 class AssetCache:
@@ -13,15 +79,116 @@ class AssetCache:
     def __init__(self, cache_dir=CACHE_DIR, ttl_days=CACHE_TTL_DAYS):
         self.cache_dir = cache_dir
         self.ttl_seconds = ttl_days * 24 * 3600
+        # cache path -> expiry epoch for entries already known to be on disk
+        self._hit_cache = OrderedDict()
+        self._hit_lock = threading.Lock()
         os.makedirs(cache_dir, exist_ok=True)
+        # In-flight downloads live here: same filesystem as the cache, so storing
+        # them is a rename, but out of reach of clear()'s stray-file sweep
+        self.tmp_dir = os.path.join(cache_dir, CACHE_TMP_DIR)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        self._index_lock = threading.Lock()
+        self._index = self._open_index()
+        # monotonic time of the next expired-entry sweep; 0 sweeps on first get()
+        self._next_sweep = 0.0
+        # (monotonic time, (bytes, files)) of the last size query; reset on any index change
+        self._size_memo = None
+
+    def _open_index(self) -> sqlite3.Connection:
+        """Open (or create) the SQLite index that describes the cached files."""
+        conn = sqlite3.connect(
+            os.path.join(self.cache_dir, CACHE_INDEX_NAME), check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            "path TEXT PRIMARY KEY, size INTEGER NOT NULL, "
+            "mtime REAL NOT NULL, expiry REAL NOT NULL)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS entries_expiry ON entries (expiry)")
+        conn.commit()
+        return conn
 
     def _get_cache_path(self, asset_id: str, asset_type: str, resolution: str = "") -> str:
         """Generate cache file path from asset identifiers."""
-        import hashlib
+        cache_hash = _cache_key_hash(asset_id, asset_type, resolution)
+        # "v2_" marks the BLAKE2b key format; older SHA-256 entries are never
+        # looked up again and are removed by clear().
+        return os.path.join(self.cache_dir, f"v2_{cache_hash}.cache")
+
+    def _remember_hit(self, cache_path: str, expires_at: float) -> None:
+        """Record a known-good cache entry, evicting the oldest beyond the cap."""
+        with self._hit_lock:
+            self._hit_cache[cache_path] = expires_at
+            self._hit_cache.move_to_end(cache_path)
+            if len(self._hit_cache) > CACHE_HIT_ENTRIES:
+                self._hit_cache.popitem(last=False)
+
+    def _recall_hit(self, cache_path: str) -> bool:
+        """Return True if cache_path is a remembered, unexpired entry."""
+        with self._hit_lock:
+            expires_at = self._hit_cache.get(cache_path)
+            if expires_at is None:
+                return False
+            if time.time() < expires_at:
+                self._hit_cache.move_to_end(cache_path)
+                return True
+            del self._hit_cache[cache_path]
+            return False
+
+    def _index_expiry(self, cache_path: str) -> float | None:
+        """Return the indexed expiry epoch for a cache path, None if not indexed."""
+        with self._index_lock:
+            row = self._index.execute(
+                "SELECT expiry FROM entries WHERE path = ?", (cache_path,)
+            ).fetchone()
+        return None if row is None else row[0]
 
-        cache_key = f"{asset_id}_{asset_type}_{resolution}"
-        cache_hash = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
-        return os.path.join(self.cache_dir, f"{cache_hash}.cache")
+    def _index_put(self, cache_path: str) -> float:
+        """Index a cached file and return its expiry epoch."""
+        st = os.stat(cache_path)
+        expires_at = st.st_mtime + self.ttl_seconds
+        with self._index_lock:
+            self._index.execute(
+                "INSERT OR REPLACE INTO entries (path, size, mtime, expiry) VALUES (?, ?, ?, ?)",
+                (cache_path, st.st_size, st.st_mtime, expires_at),
+            )
+            self._index.commit()
+            self._size_memo = None
+        return expires_at
+
+    def _index_drop(self, cache_path: str) -> None:
+        """Remove a cache entry from the index and from disk."""
+        # Evict and delete under _hit_lock so get() never serves a removed file
+        with self._hit_lock:
+            self._hit_cache.pop(cache_path, None)
+            with self._index_lock:
+                self._index.execute("DELETE FROM entries WHERE path = ?", (cache_path,))
+                self._index.commit()
+                self._size_memo = None
+            with suppress(FileNotFoundError):
+                os.remove(cache_path)
+
+    def _sweep_expired(self) -> int:
+        """Drop every expired entry in one batch. Returns number of entries removed."""
+        now = time.time()
+        with self._hit_lock:
+            with self._index_lock:
+                paths = [
+                    row[0]
+                    for row in self._index.execute(
+                        "SELECT path FROM entries WHERE expiry <= ?", (now,)
+                    )
+                ]
+                self._index.execute("DELETE FROM entries WHERE expiry <= ?", (now,))
+                self._index.commit()
+                self._size_memo = None
+            for path in paths:
+                self._hit_cache.pop(path, None)
+                with suppress(FileNotFoundError):
+                    os.remove(path)
+        return len(paths)
 
     def get(self, asset_id: str, asset_type: str, resolution: str = "") -> str | None:
         """Retrieve cached asset path if valid, None otherwise. Logs hit/miss/expire and timing."""
@@ -31,71 +198,173 @@ class AssetCache:
         logger = logging.getLogger("AssetCache")
         cache_path = self._get_cache_path(asset_id, asset_type, resolution)
 
-        if not os.path.exists(cache_path):
+        if time.monotonic() >= self._next_sweep:
+            self._next_sweep = time.monotonic() + CACHE_SWEEP_INTERVAL
+            try:
+                swept = self._sweep_expired()
+                if swept:
+                    logger.info(f"Cache swept {swept} expired entries")
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"Failed to sweep expired cache entries: {e}")
+
+        # Memory hits skip the index but still confirm the file is there
+        if self._recall_hit(cache_path):
+            if os.path.exists(cache_path):
+                logger.info(f"Cache HIT for {asset_id} [{asset_type}/{resolution}] (memory)")
+                return cache_path
+            # Deleted behind the cache's back; the index lookup below drops it too
+            with self._hit_lock:
+                self._hit_cache.pop(cache_path, None)
+
+        expires_at = self._index_expiry(cache_path)
+        if expires_at is None:
             logger.info(f"Cache MISS for {asset_id} [{asset_type}/{resolution}]")
             logger.debug(f"Checked path: {cache_path}")
             logger.info(f"Cache lookup took {time.time() - start:.4f}s")
             return None
 
         # Check if cache is expired
-        file_age = time.time() - os.path.getmtime(cache_path)
-        if file_age > self.ttl_seconds:
+        if time.time() >= expires_at:
             try:
-                os.remove(cache_path)
+                self._index_drop(cache_path)
                 logger.info(f"Cache EXPIRED for {asset_id} [{asset_type}/{resolution}]")
             except Exception as e:
                 logger.warning(f"Failed to remove expired cache: {e}")
             logger.info(f"Cache lookup took {time.time() - start:.4f}s")
             return None
 
+        # The index can outlive files deleted behind its back (another Blender
+        # process clearing the cache, a removed cache folder); forget those
+        if not os.path.exists(cache_path):
+            try:
+                self._index_drop(cache_path)
+                logger.info(f"Cache MISSING for {asset_id} [{asset_type}/{resolution}]")
+            except sqlite3.Error as e:
+                logger.warning(f"Failed to drop missing cache entry: {e}")
+            logger.info(f"Cache lookup took {time.time() - start:.4f}s")
+            return None
+
+        self._remember_hit(cache_path, expires_at)
         logger.info(f"Cache HIT for {asset_id} [{asset_type}/{resolution}]")
         logger.info(f"Cache lookup took {time.time() - start:.4f}s")
         return cache_path
 
-    def put(self, asset_id: str, asset_type: str, source_path: str, resolution: str = "") -> str:
-        """Store asset in cache and return cache path. Logs operation and timing."""
+    def put(
+        self,
+        asset_id: str,
+        asset_type: str,
+        source_path: str,
+        resolution: str = "",
+        move: bool = False,
+    ) -> str:
+        """Store asset in cache and return cache path. Logs operation and timing.
+
+        With move=True the source is renamed into the cache when it is on the
+        same filesystem, so the caller must not use source_path afterwards.
+        """
         import logging
 
         start = time.time()
         logger = logging.getLogger("AssetCache")
         cache_path = self._get_cache_path(asset_id, asset_type, resolution)
 
+        moved = False
         try:
-            shutil.copy2(source_path, cache_path)
+            # Callers done with the source let it be renamed in; across filesystems
+            # it is copied as usual and stays where it was
+            moved = move and _move_file(source_path, cache_path)
+            if not moved:
+                _copy_file(source_path, cache_path)
+            # rename and copy both preserve the source mtime, which expiry is based on
+            self._remember_hit(cache_path, self._index_put(cache_path))
             logger.info(f"Cached asset {asset_id} [{asset_type}/{resolution}] at {cache_path}")
             logger.info(f"Cache store took {time.time() - start:.4f}s")
             return cache_path
         except Exception as e:
             logger.error(f"Failed to cache asset: {e}")
             logger.info(f"Cache store took {time.time() - start:.4f}s")
+            if moved:
+                # The source was renamed away; put it back so the returned path exists
+                try:
+                    os.replace(cache_path, source_path)
+                except OSError:
+                    return cache_path
             return source_path
 
     def clear(self) -> int:
         """Clear all cached assets. Returns number of files deleted."""
         deleted = 0
         try:
-            for filename in os.listdir(self.cache_dir):
-                filepath = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(filepath):
-                    os.remove(filepath)
-                    deleted += 1
+            # Memory hits are evicted in the same critical section as the deletes
+            with self._hit_lock:
+                self._hit_cache.clear()
+                with self._index_lock:
+                    paths = [row[0] for row in self._index.execute("SELECT path FROM entries")]
+                    self._index.execute("DELETE FROM entries")
+                    self._index.commit()
+                    self._size_memo = None
+                for path in paths:
+                    with suppress(FileNotFoundError):
+                        os.remove(path)
+                        deleted += 1
+                # Files that predate the index (or were never indexed) go as well
+                with os.scandir(self.cache_dir) as entries:
+                    for entry in entries:
+                        if entry.name.startswith(CACHE_INDEX_NAME):
+                            continue
+                        if entry.is_file(follow_symlinks=False):
+                            os.remove(entry.path)
+                            deleted += 1
         except Exception as e:
             print(f"Error clearing cache: {e}")
         return deleted
 
-    def get_cache_size(self) -> tuple[int, int]:
-        """Get cache size in bytes and number of files."""
-        total_size = 0
-        file_count = 0
+    def _json_path(self, key: str) -> str:
+        """Path of the metadata file stored under key."""
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.cache_dir, CACHE_META_DIR, f"{digest}.json")
+
+    def get_json(self, key: str) -> tuple[object, float] | None:
+        """Return (value, age in seconds) of stored JSON metadata, None if absent."""
+        path = self._json_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                value = json.load(f)
+            age = time.time() - os.path.getmtime(path)
+        except (OSError, ValueError):
+            return None
+        return value, age
+
+    def put_json(self, key: str, value: object) -> None:
+        """Store JSON-serializable metadata under key, replacing it atomically."""
+        path = self._json_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(value, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"Failed to store cached metadata: {e}")
+
+    def get_cache_size(self, max_age: float = 0.0) -> tuple[int, int]:
+        """Get cache size in bytes and number of files.
+
+        A result from the last max_age seconds is reused if the index has not
+        changed since, so UI redraws don't query the index every frame.
+        """
+        memo = self._size_memo
+        if memo is not None and time.monotonic() - memo[0] < max_age:
+            return memo[1]
         try:
-            for filename in os.listdir(self.cache_dir):
-                filepath = os.path.join(self.cache_dir, filename)
-                if os.path.isfile(filepath):
-                    total_size += os.path.getsize(filepath)
-                    file_count += 1
-        except OSError:
-            pass
-        return total_size, file_count
+            with self._index_lock:
+                size = self._index.execute(
+                    "SELECT COALESCE(SUM(size), 0), COUNT(*) FROM entries"
+                ).fetchone()
+                self._size_memo = (time.monotonic(), size)
+        except sqlite3.Error:
+            return 0, 0
+        return size
 
 
 # Global cache instance
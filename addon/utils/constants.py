@@ -2,12 +2,15 @@
 
 import os
 
-import requests
-
-# Add User-Agent as required by Poly Haven API
-REQ_HEADERS = requests.utils.default_headers()
-REQ_HEADERS.update({"User-Agent": "blender-mcp"})
+# Add User-Agent as required by Poly Haven API. A plain dict is cheaper for
+# requests to merge than CaseInsensitiveDict; gzip keeps JSON listings small.
+REQ_HEADERS = {"User-Agent": "blender-mcp", "Accept-Encoding": "gzip, deflate"}
 
 # MP-05: Asset cache configuration
 CACHE_DIR = os.path.join(os.path.expanduser("~"), ".blender_mcp", "cache")
 CACHE_TTL_DAYS = 7  # Cache expires after 7 days
+CACHE_HIT_ENTRIES = 1024  # In-memory hit entries kept by AssetCache
+CACHE_INDEX_NAME = "index.db"  # SQLite index of cached files, kept in CACHE_DIR
+CACHE_SWEEP_INTERVAL = 3600  # Seconds between batch removals of expired entries
+CACHE_META_DIR = "meta"  # Subdirectory of CACHE_DIR for cached API metadata
+CACHE_TMP_DIR = "tmp"  # Subdirectory of CACHE_DIR for in-flight downloads
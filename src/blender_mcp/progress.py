@@ -4,6 +4,7 @@ This module provides progress tracking infrastructure for downloads
 and other long-running operations in the Blender addon.
 """
 
+import threading
 import time
 from collections.abc import Callable
 from dataclasses import dataclass
@@ -73,11 +74,14 @@ class ProgressTracker:
 
     This is used by the Blender addon to track download progress
     and can be queried by the MCP server to show progress to users.
+    Downloads report from worker threads, so state changes are made under
+    a lock; callbacks run outside it.
     """
 
     def __init__(self):
         self._operations: dict[str, ProgressInfo] = {}
         self._callbacks: list[Callable[[ProgressInfo], None]] = []
+        self._lock = threading.Lock()
 
     def start_operation(self, operation_id: str, total_bytes: int) -> ProgressInfo:
         """Start tracking a new operation.
@@ -96,7 +100,8 @@ class ProgressTracker:
             start_time=time.time(),
             status="running",
         )
-        self._operations[operation_id] = progress
+        with self._lock:
+            self._operations[operation_id] = progress
         self._notify_callbacks(progress)
         return progress
 
@@ -110,57 +115,67 @@ class ProgressTracker:
         Returns:
             Updated ProgressInfo
         """
-        if operation_id not in self._operations:
-            raise ValueError(f"Unknown operation: {operation_id}")
+        with self._lock:
+            progress = self._operations.get(operation_id)
+            if progress is None:
+                raise ValueError(f"Unknown operation: {operation_id}")
+            progress.downloaded_bytes = downloaded_bytes
 
-        progress = self._operations[operation_id]
-        progress.downloaded_bytes = downloaded_bytes
-
-        # Auto-complete when done
-        if downloaded_bytes >= progress.total_bytes:
-            progress.status = "completed"
+            # Auto-complete when done
+            if downloaded_bytes >= progress.total_bytes:
+                progress.status = "completed"
 
         self._notify_callbacks(progress)
         return progress
 
+    def _set_status(
+        self, operation_id: str, status: str, error_message: str | None = None
+    ) -> None:
+        """Set an operation's status and notify callbacks; unknown ids are ignored."""
+        with self._lock:
+            progress = self._operations.get(operation_id)
+            if progress is None:
+                return
+            progress.status = status
+            if error_message is not None:
+                progress.error_message = error_message
+        self._notify_callbacks(progress)
+
     def complete_operation(self, operation_id: str) -> None:
         """Mark operation as completed."""
-        if operation_id in self._operations:
-            self._operations[operation_id].status = "completed"
-            self._notify_callbacks(self._operations[operation_id])
+        self._set_status(operation_id, "completed")
 
     def cancel_operation(self, operation_id: str) -> None:
         """Mark operation as cancelled."""
-        if operation_id in self._operations:
-            self._operations[operation_id].status = "cancelled"
-            self._notify_callbacks(self._operations[operation_id])
+        self._set_status(operation_id, "cancelled")
 
     def error_operation(self, operation_id: str, error_message: str) -> None:
         """Mark operation as errored."""
-        if operation_id in self._operations:
-            progress = self._operations[operation_id]
-            progress.status = "error"
-            progress.error_message = error_message
-            self._notify_callbacks(progress)
+        self._set_status(operation_id, "error", error_message)
 
     def get_progress(self, operation_id: str) -> ProgressInfo | None:
         """Get progress for an operation."""
-        return self._operations.get(operation_id)
+        with self._lock:
+            return self._operations.get(operation_id)
 
     def get_all_operations(self) -> dict[str, ProgressInfo]:
         """Get all tracked operations."""
-        return self._operations.copy()
+        with self._lock:
+            return self._operations.copy()
 
     def register_callback(self, callback: Callable[[ProgressInfo], None]) -> None:
         """Register callback for progress updates.
 
         Callback will be called whenever progress is updated.
         """
-        self._callbacks.append(callback)
+        with self._lock:
+            self._callbacks.append(callback)
 
     def _notify_callbacks(self, progress: ProgressInfo) -> None:
         """Notify all registered callbacks."""
-        for callback in self._callbacks:
+        with self._lock:
+            callbacks = list(self._callbacks)
+        for callback in callbacks:
             try:
                 callback(progress)
             except Exception as e:
@@ -178,24 +193,28 @@ class ProgressTracker:
         now = time.time()
         to_remove = []
 
-        for op_id, progress in self._operations.items():
-            if progress.status in ("completed", "cancelled", "error"):
-                if now - progress.start_time > max_age_seconds:
-                    to_remove.append(op_id)
+        with self._lock:
+            for op_id, progress in self._operations.items():
+                if progress.status in ("completed", "cancelled", "error"):
+                    if now - progress.start_time > max_age_seconds:
+                        to_remove.append(op_id)
 
-        for op_id in to_remove:
-            del self._operations[op_id]
+            for op_id in to_remove:
+                del self._operations[op_id]
 
         return len(to_remove)
 
 
 # Global progress tracker instance
 _global_tracker: ProgressTracker | None = None
+_global_tracker_lock = threading.Lock()
 
 
 def get_progress_tracker() -> ProgressTracker:
     """Get global progress tracker instance."""
     global _global_tracker
     if _global_tracker is None:
-        _global_tracker = ProgressTracker()
+        with _global_tracker_lock:
+            if _global_tracker is None:
+                _global_tracker = ProgressTracker()
     return _global_tracker
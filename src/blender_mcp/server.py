@@ -774,6 +774,60 @@ def set_texture(ctx: Context, object_name: str, texture_id: str) -> str:
         )
 
 
+@mcp.tool()
+def set_textures_bulk(ctx: Context, assignments: list[dict[str, str]]) -> str:
+    """
+    Apply previously downloaded Polyhaven textures to several objects at once.
+    Faster than calling set_texture repeatedly, since Blender refreshes the scene only once.
+
+    Parameters:
+    - assignments: List of {"object_name": ..., "texture_id": ...} entries
+
+    Returns a summary line per object.
+    """
+    from blender_mcp.shared.validators import ValidationError, validate_asset_id
+
+    pairs = []
+    for entry in assignments:
+        object_name = entry.get("object_name") if isinstance(entry, dict) else None
+        if not object_name or not isinstance(object_name, str):
+            return tool_error(
+                "Invalid object name", data={"detail": "Object name must be a non-empty string"}
+            )
+        try:
+            texture_id = validate_asset_id(entry.get("texture_id"))
+        except ValidationError as e:
+            return tool_error(
+                "Invalid texture ID", data={"detail": str(e), "texture_id": entry.get("texture_id")}
+            )
+        pairs.append([object_name, texture_id])
+
+    if not pairs:
+        return tool_error("No assignments", data={"detail": "Provide at least one assignment"})
+
+    try:
+        blender = get_blender_connection()
+        result = blender.send_command("set_textures_bulk", {"assignments": pairs})
+
+        if "error" in result:
+            return tool_error("Failed to apply textures", data={"detail": result["error"]})
+
+        lines = [f"Applied {result.get('applied', 0)} of {len(pairs)} textures."]
+        for item in result.get("results", []):
+            if item.get("success"):
+                lines.append(
+                    f"- {item['object_name']}: '{item['texture_id']}' via material '{item.get('material', '')}'"
+                )
+            else:
+                lines.append(
+                    f"- {item['object_name']}: failed ({item.get('error', 'Unknown error')})"
+                )
+        return "\n".join(lines)
+    except Exception as e:
+        logger.error(f"Error applying textures: {str(e)}")
+        return tool_error("Error applying textures", data={"detail": str(e)})
+
+
 @mcp.tool()
 def get_polyhaven_status(ctx: Context) -> str:
     """
@@ -795,6 +849,21 @@ def get_polyhaven_status(ctx: Context) -> str:
         return tool_error("Error checking PolyHaven status", data={"detail": str(e)})
 
 
+@mcp.tool()
+def clear_asset_cache(ctx: Context) -> str:
+    """
+    Delete the assets Blender has cached from previous Poly Haven downloads.
+    Later downloads fetch from the network again.
+    """
+    try:
+        blender = get_blender_connection()
+        result = blender.send_command("clear_asset_cache")
+        return f"Cleared {result.get('deleted', 0)} cached asset files"
+    except Exception as e:
+        logger.error(f"Error clearing asset cache: {str(e)}")
+        return tool_error("Error clearing asset cache", data={"detail": str(e)})
+
+
 @mcp.tool()
 def get_sketchfab_status(ctx: Context) -> str:
     """
@@ -0,0 +1,217 @@
+"""Tests for the addon asset cache (MP-05)."""
+
+import errno
+import os
+
+import pytest
+
+from addon.utils import cache as cache_module
+from addon.utils.cache import AssetCache
+
+
+def _write(path, size):
+    with open(path, "wb") as f:
+        f.write(b"x" * size)
+
+
+def test_get_cache_size_reports_indexed_entries(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    _write(tmp_path / "a.hdr", 10)
+    _write(tmp_path / "b.hdr", 32)
+    cache.put("a", "hdris", str(tmp_path / "a.hdr"))
+    cache.put("b", "hdris", str(tmp_path / "b.hdr"))
+
+    assert cache.get_cache_size() == (42, 2)
+
+
+def test_clear_removes_indexed_and_stray_files(tmp_path):
+    cache_dir = tmp_path / "cache"
+    cache = AssetCache(cache_dir=str(cache_dir))
+    _write(tmp_path / "a.hdr", 1)
+    cache.put("a", "hdris", str(tmp_path / "a.hdr"))
+    _write(cache_dir / "legacy.cache", 1)
+    os.makedirs(cache_dir / "subdir")
+
+    assert cache.clear() == 2
+    assert cache.get_cache_size() == (0, 0)
+    assert all(p.name.startswith("index.db") for p in cache_dir.iterdir() if p.is_file())
+    assert (cache_dir / "subdir").is_dir()
+
+
+def test_put_then_get_roundtrip(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "asset.hdr"
+    _write(source, 8)
+
+    cached = cache.put("forest", "hdris", str(source), resolution="1k")
+
+    assert cache.get("forest", "hdris", resolution="1k") == cached
+    assert cache.get("forest", "hdris", resolution="2k") is None
+
+
+def test_repeated_get_is_served_from_memory(tmp_path, monkeypatch):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "asset.hdr"
+    _write(source, 8)
+    cached = cache.put("forest", "hdris", str(source), resolution="1k")
+
+    def _no_index(_path):
+        raise AssertionError("index should not be queried on a memory hit")
+
+    monkeypatch.setattr(cache, "_index_expiry", _no_index)
+    assert cache.get("forest", "hdris", resolution="1k") == cached
+
+
+def test_clear_invalidates_memory_hits(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "asset.hdr"
+    _write(source, 8)
+    cache.put("forest", "hdris", str(source), resolution="1k")
+
+    cache.clear()
+
+    assert cache.get("forest", "hdris", resolution="1k") is None
+
+
+def test_put_preserves_content_and_mtime(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "asset.hdr"
+    source.write_bytes(b"0123456789" * 1000)
+    os.utime(source, (1_700_000_000, 1_700_000_000))
+
+    cached = cache.put("forest", "hdris", str(source))
+
+    with open(cached, "rb") as f:
+        assert f.read() == source.read_bytes()
+    assert os.path.getmtime(cached) == 1_700_000_000
+
+
+@pytest.mark.skipif(not hasattr(os, "copy_file_range"), reason="copy_file_range unavailable")
+def test_put_falls_back_when_copy_file_range_unsupported(tmp_path, monkeypatch):
+    def _unsupported(*_args, **_kwargs):
+        raise OSError(errno.EXDEV, "cross-device")
+
+    monkeypatch.setattr(cache_module.os, "copy_file_range", _unsupported)
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "asset.hdr"
+    source.write_bytes(b"payload")
+
+    cached = cache.put("forest", "hdris", str(source))
+
+    with open(cached, "rb") as f:
+        assert f.read() == b"payload"
+
+
+def test_index_is_shared_across_instances(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    source = tmp_path / "asset.hdr"
+    _write(source, 8)
+    cached = AssetCache(cache_dir=cache_dir).put("forest", "hdris", str(source))
+
+    assert AssetCache(cache_dir=cache_dir).get("forest", "hdris") == cached
+
+
+def test_get_sweeps_all_expired_entries(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"), ttl_days=1)
+    for name in ("old", "older"):
+        source = tmp_path / f"{name}.hdr"
+        _write(source, 4)
+        os.utime(source, (1_000_000_000, 1_000_000_000))
+        cache.put(name, "hdris", str(source))
+    fresh = tmp_path / "fresh.hdr"
+    _write(fresh, 4)
+    kept = cache.put("fresh", "hdris", str(fresh))
+
+    assert cache.get("unrelated", "hdris") is None
+
+    assert cache.get_cache_size() == (4, 1)
+    assert [p.name for p in (tmp_path / "cache").glob("*.cache")] == [os.path.basename(kept)]
+
+
+def test_cache_size_memo_is_reset_by_put_and_clear(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "asset.hdr"
+    _write(source, 8)
+
+    assert cache.get_cache_size(max_age=60) == (0, 0)
+    cache.put("forest", "hdris", str(source))
+    assert cache.get_cache_size(max_age=60) == (8, 1)
+
+    cache.clear()
+    assert cache.get_cache_size(max_age=60) == (0, 0)
+
+
+def test_put_with_move_renames_source_into_cache(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "model.zip"
+    source.write_bytes(b"archive")
+
+    cached = cache.put("uid", "sketchfab", str(source), "gltf.zip", move=True)
+
+    assert not source.exists()
+    assert cache.get("uid", "sketchfab", "gltf.zip") == cached
+    with open(cached, "rb") as f:
+        assert f.read() == b"archive"
+
+
+def test_json_metadata_roundtrip_across_instances(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    assert AssetCache(cache_dir=cache_dir).get_json("categories") is None
+
+    AssetCache(cache_dir=cache_dir).put_json("categories", ["etag", {"all": 3}])
+
+    value, age = AssetCache(cache_dir=cache_dir).get_json("categories")
+    assert value == ["etag", {"all": 3}]
+    assert 0 <= age < 60
+
+
+def test_put_with_move_returns_existing_path_when_indexing_fails(tmp_path, monkeypatch):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "model.zip"
+    source.write_bytes(b"archive")
+
+    def _broken_index(_path):
+        raise OSError("index unavailable")
+
+    monkeypatch.setattr(cache, "_index_put", _broken_index)
+    returned = cache.put("uid", "sketchfab", str(source), "gltf.zip", move=True)
+
+    assert returned == str(source)
+    with open(returned, "rb") as f:
+        assert f.read() == b"archive"
+    assert [p.name for p in (tmp_path / "cache").glob("*.cache")] == []
+
+
+def test_get_drops_index_entry_whose_file_was_deleted(tmp_path):
+    cache_dir = str(tmp_path / "cache")
+    source = tmp_path / "asset.hdr"
+    _write(source, 8)
+    cached = AssetCache(cache_dir=cache_dir).put("forest", "hdris", str(source))
+    os.remove(cached)
+
+    cache = AssetCache(cache_dir=cache_dir)
+    assert cache.get("forest", "hdris") is None
+    assert cache.get_cache_size() == (0, 0)
+
+
+def test_memory_hit_for_deleted_file_is_dropped(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "asset.hdr"
+    _write(source, 8)
+    cached = cache.put("forest", "hdris", str(source))
+    assert cache.get("forest", "hdris") == cached
+
+    os.remove(cached)
+
+    assert cache.get("forest", "hdris") is None
+    assert cache.get_cache_size() == (0, 0)
+
+
+def test_clear_keeps_in_flight_downloads(tmp_path):
+    cache = AssetCache(cache_dir=str(tmp_path / "cache"))
+    part = os.path.join(cache.tmp_dir, "download.part")
+    _write(part, 4)
+
+    cache.clear()
+
+    assert os.path.exists(part)
@@ -191,6 +191,27 @@ class TestProgressTracker:
         assert tracker.get_progress("old_op") is None
         assert tracker.get_progress("new_op") is not None
 
+    def test_concurrent_operations_from_threads(self):
+        """Worker threads can start, update and finish operations concurrently."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        tracker = ProgressTracker()
+
+        def download(i):
+            op_id = f"op_{i}"
+            tracker.start_operation(op_id, 100)
+            for downloaded in range(0, 101, 10):
+                tracker.update_progress(op_id, downloaded)
+            tracker.complete_operation(op_id)
+            tracker.cleanup_completed(max_age_seconds=300)
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(download, range(64)))
+
+        operations = tracker.get_all_operations()
+        assert len(operations) == 64
+        assert all(p.status == "completed" for p in operations.values())
+
     def test_global_tracker(self):
         """Test global tracker singleton."""
         tracker1 = get_progress_tracker()